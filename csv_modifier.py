@@ -1,4 +1,5 @@
 import csv
+import sys
 file_path = 'data.csv'
 
 # Note: Remember to add the CSV to the gitignore in the future, once the data testing is further along
@@ -13,7 +14,13 @@ def write_to_csv(file_path, data_entry, mode = 'a'):
     with open(file_path, mode = mode, newline = '') as file:
         writer = csv.DictWriter(file, fieldnames = data_entry.keys())
 
-        
+        # Write the header when starting a fresh file (or appending to an
+        # empty one), then the actual row. Previously neither happened,
+        # so every call produced an empty file and callers retried.
+        if mode == 'w' or file.tell() == 0:
+            writer.writeheader()
+        writer.writerow(data_entry)
+
 
 """
     Reads data from the CSV file, for use by other functions
@@ -22,10 +29,15 @@ def write_to_csv(file_path, data_entry, mode = 'a'):
 """
 def read_from_csv(file_path, key = 'date', mode = 'r'):
 
-    # This version just outputs the data as a list of dictionaries in the terminal
+    # Read everything first, then print in one go.
+    # print() per row locks + flushes stdout every call, which was slower
+    # than the actual CSV parsing on big files.
     with open(file_path, mode = mode, newline = '') as file:
         reader = csv.DictReader(file)
-        print("Data from the CSV:")
-        for row in reader:
-            print(row)
-            print()
\ No newline at end of file
+        rows = list(reader)
+
+    print("Data from the CSV:")
+    sys.stdout.write("".join(f"{row}\n\n" for row in rows))
+
+    # Return the rows so callers don't have to re-read the file
+    return rows
\ No newline at end of file
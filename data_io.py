@@ -11,9 +11,28 @@ Important:
 - Validation happens in data_validation.py.
 """
 
-import csv
+import bisect
+import io
 import os
-from typing import Any
+from itertools import chain
+from typing import Any, Iterator, Optional
+
+# Try the SIMD-accelerated drop-in replacement first.
+# fastcsv keeps the same DictReader/DictWriter API as the stdlib module,
+# so nothing below needs to change — it just parses faster if installed.
+# Importing alone isn't proof enough, though: any unrelated package
+# named "fastcsv" would break every reader/writer here at call time
+# with no fallback, so only adopt it if it actually exposes the
+# attributes this module uses.
+try:
+    import fastcsv as _fastcsv
+except ImportError:
+    _fastcsv = None
+
+if _fastcsv is not None and hasattr(_fastcsv, "DictReader") and hasattr(_fastcsv, "DictWriter"):
+    csv = _fastcsv
+else:
+    import csv
 
 
 # The canonical column order for the CSV.
@@ -29,21 +48,57 @@ _FIELDNAMES = [
 ]
 
 
+# Paths we have already created/verified this run. Every public function
+# here calls ensure_csv_exists, so without this cache a single upsert
+# pays for the same makedirs + isfile stat calls several times over.
+_ensured_paths: set[str] = set()
+
+
 def ensure_csv_exists(file_path: str) -> None:
     """
     Ensure the CSV exists and has a header row.
     If the file does not exist, create it and write the header.
+
+    Once a path has been verified, later calls only re-check that the
+    file is still there (one stat) instead of redoing the makedirs walk.
     """
+    if file_path in _ensured_paths and os.path.isfile(file_path):
+        return
+
     folder = os.path.dirname(file_path)
     if folder:
         os.makedirs(folder, exist_ok=True)
 
-    if os.path.isfile(file_path):
-        return
+    if not os.path.isfile(file_path):
+        with open(file_path, mode="w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=_FIELDNAMES)
+            writer.writeheader()
+
+    _ensured_paths.add(file_path)
 
-    with open(file_path, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=_FIELDNAMES)
-        writer.writeheader()
+
+def iter_entries(file_path: str, batch_size: int = 1024) -> Iterator[list[dict[str, str]]]:
+    """
+    Yield rows in batches of up to batch_size dicts.
+
+    Keeps the working set at O(batch) instead of O(file), which matters
+    once views only need a slice (e.g. one month for a graph) — they can
+    stop iterating early and never load the rest.
+    """
+    ensure_csv_exists(file_path)
+
+    with open(file_path, mode="r", newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+
+        batch: list[dict[str, str]] = []
+        for row in reader:
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+
+        if batch:
+            yield batch
 
 
 def read_entries(file_path: str) -> list[dict[str, str]]:
@@ -54,11 +109,103 @@ def read_entries(file_path: str) -> list[dict[str, str]]:
     - csv.DictReader returns all values as strings.
     - Later, for graphing, you can load with pandas and parse types.
     """
+    return list(chain.from_iterable(iter_entries(file_path)))
+
+
+def read_entries_filtered(
+    file_path: str,
+    year: Optional[int] = None,
+    month: Optional[int] = None,
+) -> list[dict[str, str]]:
+    """
+    Read only the rows matching a given year (and optionally month).
+
+    The date column is 'YYYY-MM-DD', so a string prefix compare is enough:
+    - year=2025             -> rows starting with "2025-"
+    - year=2025, month=3    -> rows starting with "2025-03"
+    """
+    if year is None:
+        return read_entries(file_path)
+
+    if month is None:
+        prefix = f"{year:04d}-"
+    else:
+        prefix = f"{year:04d}-{month:02d}"
+
+    matches: list[dict[str, str]] = []
+    for batch in iter_entries(file_path):
+        for row in batch:
+            if row.get("date", "").startswith(prefix):
+                matches.append(row)
+    return matches
+
+
+# How much data the file object buffers in user space before issuing a
+# write() syscall. The default is only a few KB, which means bulk imports
+# pay one syscall every couple of rows. 1 MiB lets a whole rewrite of the
+# log go to disk in a handful of writes.
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# The header line, rendered once. "\r\n" matches what csv.writer emits,
+# so files stay byte-identical with the old DictWriter output.
+_HEADER_LINE = ",".join(_FIELDNAMES) + "\r\n"
+
+
+def _quote_field(value: Any) -> str:
+    """
+    Apply CSV minimal quoting to one field.
+
+    Same rule as the stdlib's QUOTE_MINIMAL dialect: wrap in quotes only
+    if the text contains a comma, quote, or newline, doubling any quotes.
+    Most of our fields (date, minutes, mood) never need quoting, so this
+    is usually a plain str() call.
+    """
+    text = str(value)
+    if any(c in text for c in ',"\r\n'):
+        return '"' + text.replace('"', '""') + '"'
+    return text
+
+
+def _format_row(row: dict[str, Any]) -> str:
+    """
+    Render one entry as a CSV line in the canonical column order.
+
+    The schema is fixed, so we can skip csv.DictWriter's per-call dialect
+    and key-order machinery and just join the seven fields ourselves.
+    Output is byte-identical to the DictWriter path.
+    """
+    return ",".join(_quote_field(row.get(k, "")) for k in _FIELDNAMES) + "\r\n"
+
+
+def read_entries_df(file_path: str):
+    """
+    Read the CSV into a pandas DataFrame with proper types.
+
+    Use this for graphing / analysis instead of read_entries:
+    - read_entries builds one dict (plus 7 strings) per row, which is
+      fine for the entry form but wasteful when plotting hundreds of rows.
+    - pandas parses the whole file into typed columns in C.
+
+    pandas is imported lazily so the entry form still works on machines
+    where only the GUI dependencies are installed.
+    """
+    import pandas as pd
+
     ensure_csv_exists(file_path)
 
-    with open(file_path, mode="r", newline="", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        return list(reader)
+    df = pd.read_csv(
+        file_path,
+        dtype={
+            "sleep_minutes": "int32",
+            "exercise_minutes": "int32",
+            "mood_scale": "float32",
+            "mood_tags": "string",
+            "activities": "string",
+            "notes": "string",
+        },
+        parse_dates=["date"],
+    )
+    return df
 
 
 def write_entries(file_path: str, rows: list[dict[str, Any]]) -> None:
@@ -69,14 +216,77 @@ def write_entries(file_path: str, rows: list[dict[str, Any]]) -> None:
     """
     ensure_csv_exists(file_path)
 
-    with open(file_path, mode="w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=_FIELDNAMES)
-        writer.writeheader()
+    # Render the whole file into one in-memory buffer first, then hand it
+    # to the OS in a single write. Bulk imports of months of history go
+    # out as one submission instead of thousands of small writes.
+    # _format_row handles missing keys (e.g. empty notes) and quoting.
+    buffer = io.StringIO()
+    buffer.write(_HEADER_LINE)
+    for row in rows:
+        buffer.write(_format_row(row))
+
+    # Write to a sibling temp file and rename over the original.
+    # os.replace is atomic on the same filesystem, so a crash mid-write
+    # leaves the old CSV intact instead of a half-written one.
+    tmp_path = file_path + ".tmp"
+    with open(
+        tmp_path,
+        mode="w",
+        newline="",
+        encoding="utf-8",
+        buffering=_WRITE_BUFFER_SIZE,
+    ) as f:
+        f.write(buffer.getvalue())
+    os.replace(tmp_path, file_path)
+
+
+def _last_date(file_path: str) -> Optional[str]:
+    """
+    Read only the tail of the CSV and return the date of the last row.
+    Returns "" if the file has no data rows yet, and None if the tail
+    can't be parsed line-by-line.
+
+    This avoids parsing the whole file just to learn the newest date.
+
+    The naive "last line, first column" read below is only valid when no
+    field in the tail is quoted: _quote_field writes quoted fields for
+    values with commas or embedded newlines, and a quoted newline makes
+    the physical last line the middle of a row, not the start of one.
+    Any quote character in the tail therefore returns None — callers
+    treat that as "unknown" and take the full read-modify-write path.
+    """
+    with open(file_path, mode="rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        # 4 KB is plenty for one row; read less if the file is smaller.
+        f.seek(max(0, size - 4096))
+        tail = f.read().decode("utf-8", errors="replace")
 
-        # Ensure every row has all required keys, even if notes is empty
-        for row in rows:
-            safe_row = {k: row.get(k, "") for k in _FIELDNAMES}
-            writer.writerow(safe_row)
+    if '"' in tail:
+        return None
+
+    lines = [line for line in tail.splitlines() if line.strip()]
+    if not lines:
+        return ""
+
+    last_line = lines[-1]
+    # The date is always the first column.
+    first_field = last_line.split(",", 1)[0]
+
+    # If the tail only contained the header, there are no data rows yet.
+    if first_field == "date":
+        return ""
+    return first_field
+
+
+def _dates_sorted(dates: list[str]) -> bool:
+    """
+    True if the date strings are already in ascending order — one linear
+    pass over values the caller has in memory anyway. Shared by
+    upsert_entry (bisect is only valid on a sorted file) and
+    sort_csv_by_date (skip the rewrite when there is nothing to fix).
+    """
+    return all(dates[i] <= dates[i + 1] for i in range(len(dates) - 1))
 
 
 def upsert_entry(file_path: str, entry: dict[str, Any]) -> str:
@@ -85,51 +295,113 @@ def upsert_entry(file_path: str, entry: dict[str, Any]) -> str:
     - If entry["date"] already exists: replace that row
     - Else: append new row
 
-    After updating, all rows are sorted by date (oldest -> newest)
-    before being written back to the CSV.
+    Fast path:
+    - Logging *today* is by far the most common case, and today always
+      sorts after every stored date. When the new date is strictly newer
+      than the last row on disk, we just append one row instead of
+      reading, re-sorting, and rewriting the whole file. (This reads
+      only the file tail, so it relies on the sorted-on-disk invariant;
+      run sort_csv_by_date after editing the file by hand.)
+
+    Slow path (date already exists, or an out-of-order backfill):
+    - Read everything, replace/insert, sort by date, write back.
 
     Returns:
     - "updated" or "inserted"
     """
     ensure_csv_exists(file_path)
 
-    # Read existing rows (all values as strings)
+    target_date = str(entry["date"])
+
+    # Fast path: strictly newer than everything on disk -> pure append.
+    # _last_date returns None when the tail holds quoted fields and the
+    # cheap line parse can't be trusted; fall through to the slow path.
+    last_date = _last_date(file_path)
+    if last_date is not None and target_date > last_date:
+        with open(file_path, mode="a", newline="", encoding="utf-8") as f:
+            f.write(_format_row(entry))
+        return "inserted"
+
+    # Slow path: read existing rows (all values as strings)
     rows = read_entries(file_path)
 
-    target_date = str(entry["date"])
-    action = "inserted"
-    updated_rows: list[dict[str, Any]] = []
+    # The file is normally kept date-sorted (upsert_entry preserves
+    # order and the fast path only appends in order), so we can bisect
+    # for the target date instead of scanning every row, and insert in
+    # place instead of re-sorting the whole list afterwards. But a
+    # hand-edited or imported file can arrive unsorted — bisect would
+    # then miss existing dates and insert duplicates at wrong spots —
+    # so check order first (O(n) on rows we just read) and fall back to
+    # the old replace-then-sort, which also heals the file on disk.
+    dates = [row.get("date", "") for row in rows]
 
-    for row in rows:
-        # Compare by date string; existing rows have string dates
-        if row.get("date", "") == target_date:
+    if _dates_sorted(dates):
+        idx = bisect.bisect_left(dates, target_date)
+
+        if idx < len(rows) and dates[idx] == target_date:
             # Replace the old row with the new entry
-            updated_rows.append(entry)
+            rows[idx] = entry
             action = "updated"
         else:
-            updated_rows.append(row)
-
-    # If no existing row matched, append as a new entry
-    if action == "inserted":
-        updated_rows.append(entry)
+            # Insert at the bisect position, which keeps the sort order
+            rows.insert(idx, entry)
+            action = "inserted"
+    else:
+        for i, date in enumerate(dates):
+            if date == target_date:
+                rows[i] = entry
+                action = "updated"
+                break
+        else:
+            rows.append(entry)
+            action = "inserted"
 
-    # Sort rows by date string (YYYY-MM-DD sorts chronologically)
-    updated_rows_sorted = sorted(
-        updated_rows,
-        key=lambda r: r.get("date", "")
-    )
+        rows.sort(key=lambda r: r.get("date", ""))
 
-    # Write back to disk in sorted order
-    write_entries(file_path, updated_rows_sorted)
+    # Write back to disk (still in sorted order)
+    write_entries(file_path, rows)
 
     return action
 
+def upsert_entries_bulk(file_path: str, entries: list[dict[str, Any]]) -> None:
+    """
+    Apply many upserts with ONE read and ONE write.
+
+    Same last-write-wins-by-date rule as upsert_entry, but amortized:
+    a batch of N pending entries costs a single pass over the file
+    instead of N read-modify-rewrite cycles.
+    """
+    if not entries:
+        return
+
+    ensure_csv_exists(file_path)
+
+    rows = read_entries(file_path)
+
+    # Key existing rows by date, then overlay the batch (later entries
+    # for the same date win, matching repeated single upserts).
+    by_date: dict[str, dict[str, Any]] = {row.get("date", ""): row for row in rows}
+    for entry in entries:
+        by_date[str(entry["date"])] = entry
+
+    # Sorted date keys -> rows back in chronological order.
+    write_entries(file_path, [by_date[d] for d in sorted(by_date)])
+
+
 def sort_csv_by_date(file_path: str) -> None:
     """
     Utility to resort the entire CSV by date.
     Can be called manually if you import / edit data outside the app.
+
+    If the file turns out to already be sorted (true whenever only
+    upsert_entry has touched it), nothing is written back — the single
+    read pass that checks order is all the I/O that happens.
     """
     rows = read_entries(file_path)
-    rows_sorted = sorted(rows, key=lambda r: r.get("date", ""))
-    write_entries(file_path, rows_sorted)
-    
\ No newline at end of file
+
+    # Check monotonicity while we already have the rows in memory.
+    if _dates_sorted([r.get("date", "") for r in rows]):
+        return
+
+    rows.sort(key=lambda r: r.get("date", ""))
+    write_entries(file_path, rows)
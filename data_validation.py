@@ -16,10 +16,78 @@ That is easier for the GUI:
 - also can build a full "error panel" list
 """
 
-from datetime import datetime
+from dataclasses import dataclass
 from typing import Optional, Tuple, Any
 
-from data_formatting import month_to_number, hm_to_minutes
+from data_formatting import month_to_number, hm_to_minutes, parse_iso_date
+
+# The public surface of this module. Keeps star-imports (and readers)
+# pointed at the real API instead of helpers and re-exported imports.
+__all__ = (
+    "DailyEntry",
+    "parse_int",
+    "parse_float",
+    "validate_iso_date",
+    "validate_total_minutes",
+    "validate_mood_scale",
+    "validate_required_text",
+    "validate_batch",
+    "validate_row_fast",
+    "validate_csv_stream",
+    "create_daily_entry",
+)
+
+
+# -----------------------------
+# Compact entry record for bulk paths
+# -----------------------------
+
+@dataclass(slots=True, frozen=True)
+class DailyEntry:
+    """
+    One day's entry as a compact, immutable record.
+
+    The form keeps working with plain dicts (create_daily_entry's
+    contract), but when an import or graph path materializes thousands
+    of entries at once, slots cost roughly a third of the memory of a
+    dict per row and iterate with better locality.
+    """
+    date: str
+    sleep_minutes: int
+    exercise_minutes: int
+    mood_scale: float
+    mood_tags: str
+    activities: str
+    notes: str
+
+    @classmethod
+    def from_dict(cls, entry: dict[str, Any]) -> "DailyEntry":
+        """
+        Build from a canonical entry dict (e.g. create_daily_entry output).
+        """
+        return cls(
+            date=str(entry["date"]),
+            sleep_minutes=int(entry["sleep_minutes"]),
+            exercise_minutes=int(entry["exercise_minutes"]),
+            mood_scale=float(entry["mood_scale"]),
+            mood_tags=str(entry.get("mood_tags", "")),
+            activities=str(entry.get("activities", "")),
+            notes=str(entry.get("notes", "")),
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Convert back to the canonical dict shape data_io writes out.
+        """
+        return {
+            "date": self.date,
+            "sleep_minutes": self.sleep_minutes,
+            "exercise_minutes": self.exercise_minutes,
+            "mood_scale": self.mood_scale,
+            "mood_tags": self.mood_tags,
+            "activities": self.activities,
+            "notes": self.notes,
+        }
 
 
 # -----------------------------
@@ -55,6 +123,18 @@ def parse_float(text: str, field_name: str) -> Tuple[Optional[float], Optional[s
     cleaned = text.strip()
     if cleaned == "":
         return None, f"{field_name} is required."
+
+    # Fast path: an optional single sign, digits, at most one dot —
+    # covers everything the form produces, with no exception setup.
+    # isdecimal (not isdigit) so characters like "²" — digits to
+    # isdigit but rejected by float() — fall through to the guarded
+    # path below instead of raising here.
+    core = cleaned.lstrip("+-")
+    if len(cleaned) - len(core) <= 1 and core.replace(".", "", 1).isdecimal():
+        return float(cleaned), None
+
+    # Slow path for the rarer-but-valid spellings ("1e2", "inf", ...),
+    # mostly reachable through CSV imports rather than the GUI.
     try:
         return float(cleaned), None
     except ValueError:
@@ -69,12 +149,13 @@ def parse_float(text: str, field_name: str) -> Tuple[Optional[float], Optional[s
 def validate_iso_date(iso_date: str) -> Optional[str]:
     """
     Validate that a string is a real date in YYYY-MM-DD format.
+
+    Delegates to data_formatting.parse_iso_date, which is much cheaper
+    than datetime.strptime and handles leap years the same way.
     """
-    try:
-        datetime.strptime(iso_date, "%Y-%m-%d")
-        return None
-    except ValueError:
+    if parse_iso_date(iso_date) is None:
         return "Invalid date."
+    return None
 
 
 def validate_total_minutes(total_minutes: int, field_name: str) -> Optional[str]:
@@ -104,12 +185,240 @@ def validate_required_text(text: str, field_name: str) -> Optional[str]:
     return None
 
 
+# -----------------------------
+# Batch validation (for CSV imports / graph cleaning)
+# One vectorized operation per rule instead of one Python call per row.
+# -----------------------------
+
+def validate_batch(
+    dates,
+    sleep_minutes,
+    exercise_minutes,
+    mood_scale,
+    mood_tags,
+    activities,
+) -> dict[str, Any]:
+    """
+    Validate whole columns at once with NumPy/pandas.
+
+    Each argument is an array/Series for that column. Returns a dict of
+    boolean masks, one per rule, plus "all_ok" combining them — so an
+    importer can keep the good rows and report the bad ones in one pass
+    instead of calling the scalar validate_* functions N times.
+
+    numpy/pandas are imported lazily: the entry form never needs them.
+    """
+    import numpy as np
+    import pandas as pd
+
+    # Real calendar dates in YYYY-MM-DD form; coerce turns bad rows into
+    # NaT instead of raising.
+    date_ok = (
+        pd.to_datetime(pd.Series(dates), format="%Y-%m-%d", errors="coerce")
+        .notna()
+        .to_numpy()
+    )
+
+    sleep_arr = pd.to_numeric(pd.Series(sleep_minutes), errors="coerce").to_numpy()
+    exercise_arr = pd.to_numeric(pd.Series(exercise_minutes), errors="coerce").to_numpy()
+    mood_arr = pd.to_numeric(pd.Series(mood_scale), errors="coerce").to_numpy()
+
+    # Same ranges as validate_total_minutes / validate_mood_scale.
+    # NaN compares False, so unparseable values fail automatically.
+    sleep_ok = (sleep_arr >= 0) & (sleep_arr <= 1440)
+    exercise_ok = (exercise_arr >= 0) & (exercise_arr <= 1440)
+    mood_ok = (mood_arr >= 0.0) & (mood_arr <= 10.0)
+
+    # Required text: non-blank after stripping.
+    tags_ok = (
+        pd.Series(mood_tags).fillna("").astype(str).str.strip().to_numpy() != ""
+    )
+    activities_ok = (
+        pd.Series(activities).fillna("").astype(str).str.strip().to_numpy() != ""
+    )
+
+    return {
+        "date": date_ok,
+        "sleep_minutes": sleep_ok,
+        "exercise_minutes": exercise_ok,
+        "mood_scale": mood_ok,
+        "mood_tags": tags_ok,
+        "activities": activities_ok,
+        "all_ok": np.logical_and.reduce(
+            [date_ok, sleep_ok, exercise_ok, mood_ok, tags_ok, activities_ok]
+        ),
+    }
+
+
+def validate_row_fast(row: dict[str, str], errors_out: list[str]) -> bool:
+    """
+    Validate one CSV row dict (string values) without allocating.
+
+    The caller owns errors_out and reuses it across the loop: it is
+    cleared here, then the keys of any failing fields are appended.
+    Returns True when the row is fully valid — in which case nothing at
+    all was allocated, which is what you want when checking thousands of
+    rows in a tight import loop.
+
+    For column-at-a-time data prefer validate_batch; this is for code
+    already iterating row dicts (e.g. straight from csv.DictReader).
+    """
+    errors_out.clear()
+
+    if parse_iso_date(row.get("date", "")) is None:
+        errors_out.append("date")
+
+    # isdecimal throughout, not isdigit: imported CSVs hold arbitrary
+    # strings, and isdigit passes superscript/circled digits that
+    # int()/float() reject — the row must be reported invalid, not raise.
+    sleep_text = row.get("sleep_minutes", "")
+    if not sleep_text.isdecimal() or int(sleep_text) > 1440:
+        errors_out.append("sleep_minutes")
+
+    exercise_text = row.get("exercise_minutes", "")
+    if not exercise_text.isdecimal() or int(exercise_text) > 1440:
+        errors_out.append("exercise_minutes")
+
+    mood_text = row.get("mood_scale", "").strip()
+    mood_core = mood_text.lstrip("+-")
+    if (
+        len(mood_text) - len(mood_core) > 1
+        or not mood_core.replace(".", "", 1).isdecimal()
+        or not 0.0 <= float(mood_text) <= 10.0
+    ):
+        errors_out.append("mood_scale")
+
+    if row.get("mood_tags", "").strip() == "":
+        errors_out.append("mood_tags")
+
+    if row.get("activities", "").strip() == "":
+        errors_out.append("activities")
+
+    return not errors_out
+
+
+def validate_csv_stream(file_path: str, chunksize: int = 65536):
+    """
+    Stream a CSV through validate_batch in chunks.
+
+    Yields (valid_rows, invalid_rows) DataFrame pairs per chunk, so an
+    importer can upsert the good rows and report the bad ones while only
+    ever holding one chunk in memory — parse, validate, and split happen
+    in a single sweep over the file.
+
+    Raises ValueError naming the missing column(s) if the CSV header
+    lacks any of the validated fields. That structural problem can't be
+    screened row-by-row, and handing a missing column to validate_batch
+    would only surface later as an opaque mask-length mismatch.
+    """
+    import pandas as pd
+
+    required = (
+        "date",
+        "sleep_minutes",
+        "exercise_minutes",
+        "mood_scale",
+        "mood_tags",
+        "activities",
+    )
+
+    for chunk in pd.read_csv(file_path, chunksize=chunksize, dtype=str):
+        # Every chunk shares the header, so this only ever trips on the
+        # first one — after that it is a cheap membership check.
+        missing = [name for name in required if name not in chunk.columns]
+        if missing:
+            raise ValueError(
+                f"CSV {file_path!r} is missing required column(s): "
+                + ", ".join(missing)
+            )
+
+        masks = validate_batch(
+            chunk["date"],
+            chunk["sleep_minutes"],
+            chunk["exercise_minutes"],
+            chunk["mood_scale"],
+            chunk["mood_tags"],
+            chunk["activities"],
+        )
+        ok = masks["all_ok"]
+        yield chunk[ok], chunk[~ok]
+
+
 # -----------------------------
 # Builder / coordinator
 # This is what the GUI calls on submit.
 # It returns (entry_dict, errors_dict).
 # -----------------------------
 
+def _fast_validate(
+    date_day_text: str,
+    date_month_text: str,
+    date_year_text: str,
+    sleep_hours_text: str,
+    sleep_minutes_text: str,
+    exercise_hours_text: str,
+    exercise_minutes_text: str,
+    mood_scale_text: str,
+    mood_tags_text: str,
+    activities_text: str,
+    notes_text: str,
+) -> Optional[dict[str, Any]]:
+    """
+    Happy-path validator: returns the finished entry dict if EVERY field
+    is valid, or None at the first problem.
+
+    Most submissions are valid, so this avoids the error-dict bookkeeping
+    of the full path. It never produces messages — when it returns None,
+    create_daily_entry falls back to the verbose path to report exactly
+    which fields failed.
+    """
+    # isdecimal, not isdigit: isdigit accepts superscripts like "²"
+    # that int() raises on, and this path must fail soft (return None)
+    # so the verbose path can report the field.
+    day_text = date_day_text.strip()
+    year_text = date_year_text.strip()
+    if not day_text.isdecimal() or not year_text.isdecimal():
+        return None
+
+    month_num = month_to_number(date_month_text)
+    if month_num is None:
+        return None
+
+    iso_date = f"{int(year_text):04d}-{month_num:02d}-{int(day_text):02d}"
+    if parse_iso_date(iso_date) is None:
+        return None
+
+    sleep_total = hm_to_minutes(sleep_hours_text, sleep_minutes_text, require_any=True)
+    if sleep_total is None or not 0 <= sleep_total <= 1440:
+        return None
+
+    exercise_total = hm_to_minutes(exercise_hours_text, exercise_minutes_text, require_any=True)
+    if exercise_total is None or not 0 <= exercise_total <= 1440:
+        return None
+
+    try:
+        mood_val = float(mood_scale_text.strip())
+    except ValueError:
+        return None
+    if not 0.0 <= mood_val <= 10.0:
+        return None
+
+    mood_tags = mood_tags_text.strip()
+    activities = activities_text.strip()
+    if mood_tags == "" or activities == "":
+        return None
+
+    return {
+        "date": iso_date,
+        "sleep_minutes": sleep_total,
+        "exercise_minutes": exercise_total,
+        "mood_scale": round(mood_val, 1),
+        "mood_tags": mood_tags,
+        "activities": activities,
+        "notes": notes_text.strip(),
+    }
+
+
 def create_daily_entry(
     date_day_text: str,
     date_month_text: str,
@@ -139,6 +448,18 @@ def create_daily_entry(
     - activities: str (raw comma-separated string for now)
     - notes: str
     """
+    # Try the happy path first: one pass, no error bookkeeping.
+    # Only when something is wrong do we rerun the verbose path below to
+    # work out which field(s) to blame.
+    fast_entry = _fast_validate(
+        date_day_text, date_month_text, date_year_text,
+        sleep_hours_text, sleep_minutes_text,
+        exercise_hours_text, exercise_minutes_text,
+        mood_scale_text, mood_tags_text, activities_text, notes_text,
+    )
+    if fast_entry is not None:
+        return fast_entry, {}
+
     errors: dict[str, str] = {}
 
     # -------------------------
@@ -208,11 +529,15 @@ def create_daily_entry(
     # Required text fields
     # -------------------------
 
-    mood_tags_err = validate_required_text(mood_tags_text, "Mood tags")
+    # Strip once and keep the cleaned value — the entry build below
+    # reuses it instead of stripping the same string a second time.
+    mood_tags_clean = mood_tags_text.strip()
+    mood_tags_err = validate_required_text(mood_tags_clean, "Mood tags")
     if mood_tags_err:
         errors["mood_tags"] = mood_tags_err
 
-    activities_err = validate_required_text(activities_text, "Activities")
+    activities_clean = activities_text.strip()
+    activities_err = validate_required_text(activities_clean, "Activities")
     if activities_err:
         errors["activities"] = activities_err
 
@@ -229,8 +554,8 @@ def create_daily_entry(
         "sleep_minutes": int(sleep_total),
         "exercise_minutes": int(exercise_total),
         "mood_scale": round(float(mood_val), 1),
-        "mood_tags": mood_tags_text.strip(),
-        "activities": activities_text.strip(),
+        "mood_tags": mood_tags_clean,
+        "activities": activities_clean,
         "notes": notes_clean,
     }
 
@@ -19,19 +19,21 @@ So this file ONLY cares about:
 - saving valid entries through data_io.py
 """
 
-import sys
+import os
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout,
-    QLabel, QComboBox, QLineEdit, QPushButton
+    QLabel, QComboBox, QLineEdit, QPushButton, QApplication, QSizePolicy
 )
 from PySide6.QtGui import QIntValidator, QDoubleValidator
+from PySide6.QtCore import QTimer, QThreadPool, QRunnable, QObject, Signal, Slot
 
 # Validation + parsing logic lives here
-from data_validation import create_daily_entry
+from data_validation import create_daily_entry, validate_total_minutes, parse_float, validate_mood_scale
+from data_formatting import hm_to_minutes
 
 # File I/O and CSV logic lives here
-from data_io import upsert_entry
+from data_io import upsert_entries_bulk
 
 
 # ================================================================
@@ -41,6 +43,63 @@ from data_io import upsert_entry
 CSV_PATH = "data/entries.csv"
 
 
+# ================================================================
+# Shared input validators.
+# These are stateless, so one set serves every EntryPage ever built —
+# rebuilding a page doesn't re-create seven Qt objects.
+# Built lazily because QValidator needs a QApplication to exist first.
+# ================================================================
+_SHARED_VALIDATORS = None
+
+
+def _shared_validators() -> dict:
+    global _SHARED_VALIDATORS
+    if _SHARED_VALIDATORS is None:
+        # No parent on purpose: their lifetime is the process, not a page.
+        _SHARED_VALIDATORS = {
+            "day": QIntValidator(1, 31),
+            "year": QIntValidator(1900, 2100),
+            "hours": QIntValidator(0, 24),
+            "minutes": QIntValidator(0, 59),
+            "mood": QDoubleValidator(0.0, 10.0, 1),
+        }
+    return _SHARED_VALIDATORS
+
+
+
+class _FlushSignals(QObject):
+    """
+    QRunnable can't emit signals itself, so the worker carries this
+    small QObject whose `done` fires back on the GUI thread with a
+    success flag.
+    """
+    done = Signal(bool)
+
+
+class _FlushWorker(QRunnable):
+    """
+    Writes one batch of entries to the CSV on a pool thread, so disk
+    I/O never blocks the Qt event loop mid-click.
+    """
+
+    def __init__(self, file_path: str, entries: list[dict]):
+        super().__init__()
+        self.file_path = file_path
+        self.entries = entries
+        self.signals = _FlushSignals()
+
+    def run(self) -> None:
+        # `done` must ALWAYS fire: an exception escaping here would kill
+        # the runnable silently, leaving the page's in-flight flag stuck
+        # and the batch lost. On failure (disk full, permissions, ...)
+        # the page re-queues the entries and tells the user.
+        ok = False
+        try:
+            upsert_entries_bulk(self.file_path, self.entries)
+            ok = True
+        finally:
+            self.signals.done.emit(ok)
+
 
 class EntryPage(QWidget):
     """
@@ -61,10 +120,21 @@ class EntryPage(QWidget):
     - Tables
     """
 
+    # Emitted after an entry is accepted, with its ISO date. Lets the
+    # main window mark the entries list stale without this page knowing
+    # anything about other pages.
+    entry_saved = Signal(str)
+
     def __init__(self, parent=None):
         # Initialize QWidget normally
         super().__init__(parent)
 
+        # Suspend painting while the ~40 widgets below are created and
+        # added. Each addWidget would otherwise trigger an incremental
+        # layout/geometry pass; with updates off, Qt does ONE pass when
+        # we re-enable at the bottom of __init__.
+        self.setUpdatesEnabled(False)
+
         # ================================================================
         # MAIN VERTICAL LAYOUT FOR THE PAGE
         # ================================================================
@@ -74,6 +144,15 @@ class EntryPage(QWidget):
         # ================================================================
         main_layout = QVBoxLayout(self)
 
+        # One stylesheet parse for ALL error labels: any QLabel created
+        # with _make_error_label gets role='error' and picks up this rule,
+        # instead of seven separate setStyleSheet calls (each of which
+        # would run Qt's CSS parser and re-polish that widget).
+        self.setStyleSheet("QLabel[role='error'] { color: red; }")
+
+        # Shared, stateless validators (see _shared_validators above)
+        validators = _shared_validators()
+
 
 
         # ================================================================
@@ -82,9 +161,8 @@ class EntryPage(QWidget):
         # This label prints **ALL errors together** for accessibility,
         # so the user doesn’t need to hunt around the form.
         # ================================================================
-        self.error_panel = QLabel("")
+        self.error_panel = self._make_error_label()
         self.error_panel.setWordWrap(True)           # long text wraps nicely
-        self.error_panel.setStyleSheet("color: red;")  # make it obvious
         main_layout.addWidget(self.error_panel)
 
 
@@ -110,26 +188,26 @@ class EntryPage(QWidget):
 
 
         # ---- Day Input ----
-        self.date_day = QLineEdit()
-        self.date_day.setPlaceholderText("Day")
-        self.date_day.setValidator(QIntValidator(1, 31, self))   # only 1–31
+        self.date_day = self._make_line_edit("Day", validators["day"])   # only 1–31
 
 
 
         # ---- Month Dropdown (Combo Box) ----
+        # Non-editable: each item carries its month number as userData,
+        # so reading the month is currentData() — no string parsing and
+        # no way to submit a misspelled month. Qt's built-in type-ahead
+        # still lets keyboard users jump by typing ("sep" -> September).
         self.date_month = QComboBox()
-        self.date_month.setEditable(True)  # allows typing + choosing
-        self.date_month.addItems([
+        for month_number, month_name in enumerate([
             "January", "February", "March", "April", "May", "June",
             "July", "August", "September", "October", "November", "December"
-        ])
+        ], start=1):
+            self.date_month.addItem(month_name, month_number)
 
 
 
         # ---- Year Input ----
-        self.date_year = QLineEdit()
-        self.date_year.setPlaceholderText("Year")
-        self.date_year.setValidator(QIntValidator(1900, 2100, self))
+        self.date_year = self._make_line_edit("Year", validators["year"])
 
 
 
@@ -147,69 +225,21 @@ class EntryPage(QWidget):
 
 
         # ---- Per-field error message for date ----
-        self.date_error = QLabel("")
-        self.date_error.setStyleSheet("color: red;")
+        self.date_error = self._make_error_label()
         main_layout.addWidget(self.date_error)
 
 
 
         # ================================================================
-        # SLEEP ENTRY SECTION
-        # ================================================================
-        main_layout.addWidget(QLabel("Sleep time:"))
-
-        sleep_layout = QHBoxLayout()
-
-        # HH textbox
-        self.sleep_hours = QLineEdit()
-        self.sleep_hours.setPlaceholderText("Hours")
-        self.sleep_hours.setValidator(QIntValidator(0, 24, self))
-
-        # MM textbox
-        self.sleep_minutes = QLineEdit()
-        self.sleep_minutes.setPlaceholderText("Minutes")
-        self.sleep_minutes.setValidator(QIntValidator(0, 59, self))
-
-        # Add widgets to row
-        sleep_layout.addWidget(QLabel("Hours"))
-        sleep_layout.addWidget(self.sleep_hours)
-        sleep_layout.addWidget(QLabel("Minutes"))
-        sleep_layout.addWidget(self.sleep_minutes)
-
-        main_layout.addLayout(sleep_layout)
-
-        # Error text for this section
-        self.sleep_error = QLabel("")
-        self.sleep_error.setStyleSheet("color: red;")
-        main_layout.addWidget(self.sleep_error)
-
-
-
+        # SLEEP + EXERCISE SECTIONS (identical Hours/Minutes rows)
         # ================================================================
-        # EXERCISE ENTRY SECTION
+        # Both sections are the same shape, so one data-driven loop
+        # builds them: title label, Hours/Minutes inputs with the shared
+        # validators, and an error label. setattr keeps the usual
+        # attribute names (self.sleep_hours, self.exercise_error, ...).
         # ================================================================
-        main_layout.addWidget(QLabel("Exercise time:"))
-
-        exercise_layout = QHBoxLayout()
-
-        self.exercise_hours = QLineEdit()
-        self.exercise_hours.setPlaceholderText("Hours")
-        self.exercise_hours.setValidator(QIntValidator(0, 24, self))
-
-        self.exercise_minutes = QLineEdit()
-        self.exercise_minutes.setPlaceholderText("Minutes")
-        self.exercise_minutes.setValidator(QIntValidator(0, 59, self))
-
-        exercise_layout.addWidget(QLabel("Hours"))
-        exercise_layout.addWidget(self.exercise_hours)
-        exercise_layout.addWidget(QLabel("Minutes"))
-        exercise_layout.addWidget(self.exercise_minutes)
-
-        main_layout.addLayout(exercise_layout)
-
-        self.exercise_error = QLabel("")
-        self.exercise_error.setStyleSheet("color: red;")
-        main_layout.addWidget(self.exercise_error)
+        for title, prefix in (("Sleep time:", "sleep"), ("Exercise time:", "exercise")):
+            self._add_hm_section(main_layout, title, prefix, validators)
 
 
 
@@ -218,14 +248,10 @@ class EntryPage(QWidget):
         # ================================================================
         main_layout.addWidget(QLabel("Mood scale (0.0 to 10.0):"))
 
-        self.mood_scale = QLineEdit()
-        self.mood_scale.setPlaceholderText("Example: 7.5")
-        self.mood_scale.setValidator(QDoubleValidator(0.0, 10.0, 1, self))
-
+        self.mood_scale = self._make_line_edit("Example: 7.5", validators["mood"])
         main_layout.addWidget(self.mood_scale)
 
-        self.mood_scale_error = QLabel("")
-        self.mood_scale_error.setStyleSheet("color: red;")
+        self.mood_scale_error = self._make_error_label()
         main_layout.addWidget(self.mood_scale_error)
 
 
@@ -235,12 +261,10 @@ class EntryPage(QWidget):
         # ================================================================
         main_layout.addWidget(QLabel("Mood tags (comma-separated, required):"))
 
-        self.mood_tags = QLineEdit()
-        self.mood_tags.setPlaceholderText("Example: stressed, productive")
+        self.mood_tags = self._make_line_edit("Example: stressed, productive")
         main_layout.addWidget(self.mood_tags)
 
-        self.mood_tags_error = QLabel("")
-        self.mood_tags_error.setStyleSheet("color: red;")
+        self.mood_tags_error = self._make_error_label()
         main_layout.addWidget(self.mood_tags_error)
 
 
@@ -250,12 +274,10 @@ class EntryPage(QWidget):
         # ================================================================
         main_layout.addWidget(QLabel("Activities (comma-separated, required):"))
 
-        self.activities = QLineEdit()
-        self.activities.setPlaceholderText("Example: studying, gym, music")
+        self.activities = self._make_line_edit("Example: studying, gym, music")
         main_layout.addWidget(self.activities)
 
-        self.activities_error = QLabel("")
-        self.activities_error.setStyleSheet("color: red;")
+        self.activities_error = self._make_error_label()
         main_layout.addWidget(self.activities_error)
 
 
@@ -265,8 +287,7 @@ class EntryPage(QWidget):
         # ================================================================
         main_layout.addWidget(QLabel("Notes (optional):"))
 
-        self.notes = QLineEdit()
-        self.notes.setPlaceholderText("Optional")
+        self.notes = self._make_line_edit("Optional")
         main_layout.addWidget(self.notes)
 
 
@@ -283,24 +304,259 @@ class EntryPage(QWidget):
 
 
 
+        # ================================================================
+        # ERROR-LABEL MAP
+        # ================================================================
+        # Which error label each validation key belongs to, built ONCE.
+        # show_errors just walks this instead of a chain of if-statements.
+        # The tuple order also controls how the date sub-errors are
+        # joined together on the shared date label.
+        # ================================================================
+        # ================================================================
+        # FIELD TABLES
+        # ================================================================
+        # Built once so submit_entry doesn't re-do attribute lookups or
+        # hand-write an 11-kwarg call every click — and adding a field
+        # later means touching these tables, not submit_entry.
+        # ================================================================
+
+        # create_daily_entry kwarg -> bound getter for the raw text.
+        # The month getter passes the item's month number (as text, which
+        # month_to_number's digit fast path handles) instead of the name.
+        self._field_getters = (
+            ("date_day_text", self.date_day.text),
+            ("date_month_text", lambda: str(self.date_month.currentData())),
+            ("date_year_text", self.date_year.text),
+            ("sleep_hours_text", self.sleep_hours.text),
+            ("sleep_minutes_text", self.sleep_minutes.text),
+            ("exercise_hours_text", self.exercise_hours.text),
+            ("exercise_minutes_text", self.exercise_minutes.text),
+            ("mood_scale_text", self.mood_scale.text),
+            ("mood_tags_text", self.mood_tags.text),
+            ("activities_text", self.activities.text),
+            ("notes_text", self.notes.text),
+        )
+
+        # Widgets reset after a successful save (date stays, see submit)
+        self._clearable_fields = (
+            self.sleep_hours,
+            self.sleep_minutes,
+            self.exercise_hours,
+            self.exercise_minutes,
+            self.mood_scale,
+            self.mood_tags,
+            self.activities,
+            self.notes,
+        )
+
+        # Labels that currently hold text. clear_errors only touches
+        # these, so the happy path (nothing shown, nothing to clear)
+        # does zero label writes and zero relayouts.
+        self._dirty_labels: set = set()
+
+        self._error_label_for = (
+            ("date_day", self.date_error),
+            ("date_month", self.date_error),
+            ("date_year", self.date_error),
+            ("date", self.date_error),
+            ("sleep_time", self.sleep_error),
+            ("exercise_time", self.exercise_error),
+            ("mood_scale", self.mood_scale_error),
+            ("mood_tags", self.mood_tags_error),
+            ("activities", self.activities_error),
+        )
+
+
+
+        # ================================================================
+        # PER-FIELD VALIDATION (live, debounced)
+        # ================================================================
+        # textChanged fires on every keystroke, so each section gets a
+        # 150 ms single-shot timer between the keystroke and its check:
+        # typing "125" runs the parser once, not three times, and the
+        # feedback still feels instant. Each check touches only its own
+        # error label; submit_entry still runs the full validation as
+        # the gatekeeper.
+        # ================================================================
+        self._sleep_check_timer = self._make_debounce_timer(self.check_sleep_field)
+        self._exercise_check_timer = self._make_debounce_timer(self.check_exercise_field)
+        self._mood_check_timer = self._make_debounce_timer(self.check_mood_field)
+
+        self.sleep_hours.textChanged.connect(self._sleep_check_timer.start)
+        self.sleep_minutes.textChanged.connect(self._sleep_check_timer.start)
+        self.exercise_hours.textChanged.connect(self._exercise_check_timer.start)
+        self.exercise_minutes.textChanged.connect(self._exercise_check_timer.start)
+        self.mood_scale.textChanged.connect(self._mood_check_timer.start)
+
+
+
+        # ================================================================
+        # WRITE-BEHIND BUFFER FOR SAVES
+        # ================================================================
+        # Validated entries land in _pending (keyed by date, so editing
+        # the same day twice before a flush costs nothing extra) and are
+        # written in one batch via upsert_entries_bulk, instead of a
+        # read-modify-write of the CSV on every single click.
+        #
+        # Flushes happen:
+        # - 2 seconds after the last submit (debounce timer)
+        # - immediately once the buffer is large
+        # - on app exit, so nothing is ever left unsaved
+        # ================================================================
+        self._pending: dict[str, dict] = {}
+        self._flush_batch_size = 50
+
+        # Memo of the last entry we accepted, plus the CSV's mtime at
+        # that moment. Resubmitting the exact same entry (common while
+        # fixing other fields, or double-clicking Submit) is a no-op, so
+        # it costs one hash + one stat instead of queueing a write.
+        # The mtime check means an outside edit to the CSV still forces
+        # a real save.
+        self._last_saved_hash: int | None = None
+        self._last_mtime: float = 0.0
+
+        # True while a _FlushWorker is writing on a pool thread; stops a
+        # second flush from racing the first on the same file.
+        self._flush_in_flight = False
+
+        # The batch handed to the in-flight worker. On success
+        # _on_flush_done re-emits entry_saved for its dates (so the
+        # entries list can't end up permanently missing a row it loaded
+        # past while the batch was still in memory); on failure it is
+        # re-queued into _pending instead of being lost.
+        self._flushing_entries: list[dict] = []
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(2000)
+        self._flush_timer.timeout.connect(self.flush_pending)
+
+        # On exit, flush synchronously — no event loop left for workers.
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.flush_pending_sync)
+
+        # Construction done: one layout pass instead of one per widget.
+        self.setUpdatesEnabled(True)
+
+
+
     # ================================================================
     # HELPER METHODS
     # ================================================================
 
+    def _add_hm_section(self, main_layout, title: str, prefix: str, validators: dict) -> None:
+        """
+        Build one "Hours / Minutes" section (used for sleep + exercise).
+
+        Creates and stores, via setattr:
+        - self.<prefix>_hours    (QLineEdit)
+        - self.<prefix>_minutes  (QLineEdit)
+        - self.<prefix>_error    (error QLabel)
+        """
+        main_layout.addWidget(QLabel(title))
+
+        row_layout = QHBoxLayout()
+
+        hours_edit = self._make_line_edit("Hours", validators["hours"])
+        minutes_edit = self._make_line_edit("Minutes", validators["minutes"])
+
+        row_layout.addWidget(QLabel("Hours"))
+        row_layout.addWidget(hours_edit)
+        row_layout.addWidget(QLabel("Minutes"))
+        row_layout.addWidget(minutes_edit)
+
+        main_layout.addLayout(row_layout)
+
+        error_label = self._make_error_label()
+        main_layout.addWidget(error_label)
+
+        setattr(self, f"{prefix}_hours", hours_edit)
+        setattr(self, f"{prefix}_minutes", minutes_edit)
+        setattr(self, f"{prefix}_error", error_label)
+
+
+
+    def _make_debounce_timer(self, on_timeout) -> QTimer:
+        """
+        Build one 150 ms single-shot timer that runs `on_timeout` when
+        the user pauses typing. Restarting the timer on every keystroke
+        (textChanged -> timer.start) collapses a burst of keystrokes
+        into one validation pass.
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(150)
+        timer.timeout.connect(on_timeout)
+        return timer
+
+
+
+    @staticmethod
+    def _make_error_label() -> QLabel:
+        """
+        Build one red error label. The color comes from the page-level
+        QSS rule matching role='error', so this never touches
+        setStyleSheet itself.
+        """
+        label = QLabel("")
+        label.setProperty("role", "error")
+        # Fixed vertical policy: the label's height never depends on the
+        # window, so resizes skip recomputing its size hint.
+        label.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        return label
+
+
+    @staticmethod
+    def _make_line_edit(placeholder: str, validator=None) -> QLineEdit:
+        """
+        Build one QLineEdit with its placeholder, optional validator,
+        and an Expanding/Fixed size policy. The fixed vertical hint lets
+        Qt shortcut the per-resize layout pass for every input row.
+        """
+        edit = QLineEdit()
+        edit.setPlaceholderText(placeholder)
+        if validator is not None:
+            edit.setValidator(validator)
+        edit.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+        return edit
+
+
+    def _set_label(self, label, text: str) -> None:
+        """
+        Set (or clear) a label's text while keeping the dirty-set in
+        sync, so clear_errors knows exactly which labels hold text.
+        """
+        if text:
+            label.setText(text)
+            self._dirty_labels.add(label)
+        elif label in self._dirty_labels:
+            label.clear()
+            self._dirty_labels.discard(label)
+
+
+
     def clear_errors(self) -> None:
         """
-        Clear ALL red error labels + global panel.
-        Called BEFORE validating a new submission.
+        Clear whichever labels currently hold text (tracked in
+        _dirty_labels). Called BEFORE validating a new submission.
+        When nothing is shown — the common happy path — this clears
+        nothing and Qt does no relayout at all.
+
+        Updates are suspended while the labels change so Qt repaints the
+        page once at the end instead of once per label.
         """
-        self.error_panel.setText("")
-        self.status_label.setText("")
+        if not self._dirty_labels:
+            return
 
-        self.date_error.setText("")
-        self.sleep_error.setText("")
-        self.exercise_error.setText("")
-        self.mood_scale_error.setText("")
-        self.mood_tags_error.setText("")
-        self.activities_error.setText("")
+        self.setUpdatesEnabled(False)
+        try:
+            for label in self._dirty_labels:
+                label.clear()
+            self._dirty_labels.clear()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
 
 
@@ -314,41 +570,108 @@ class EntryPage(QWidget):
 
         2) field-specific errors under each section
            - easier for the user to see where to fix things
+
+        Like clear_errors, all label writes happen inside one
+        setUpdatesEnabled block -> one repaint per submit.
         """
+        # Nothing to show -> don't even build the joined text.
+        if not errors:
+            return
 
-        # Build the global list
-        all_lines = []
-        for field, msg in errors.items():
-            all_lines.append(f"{field}: {msg}")
+        self.setUpdatesEnabled(False)
+        try:
+            # Build the global list
+            all_lines = []
+            for field, msg in errors.items():
+                all_lines.append(f"{field}: {msg}")
+
+            self._set_label(self.error_panel, "\n".join(all_lines))
+
+            # Field-specific messages, driven by the map built in
+            # __init__. The date sub-errors share one label, so messages
+            # landing on the same label are joined in map order.
+            texts: dict[int, list[str]] = {}
+            labels = {}
+            for key, label in self._error_label_for:
+                if key in errors:
+                    labels[id(label)] = label
+                    texts.setdefault(id(label), []).append(errors[key])
 
-        self.error_panel.setText("\n".join(all_lines))
+            for label_id, parts in texts.items():
+                self._set_label(labels[label_id], " ".join(parts))
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
 
-        # Field-specific messages
-        if "date" in errors or "date_day" in errors or "date_month" in errors or "date_year" in errors:
-            parts = []
-            for key in ["date_day", "date_month", "date_year", "date"]:
-                if key in errors:
-                    parts.append(errors[key])
-            self.date_error.setText(" ".join(parts))
 
-        if "sleep_time" in errors:
-            self.sleep_error.setText(errors["sleep_time"])
+    # @Slot() on every signal-connected method below, same as the other
+    # pages: registers them in the class meta-object up front so each
+    # emit skips the generic Python-callable marshalling path.
+    @Slot()
+    def check_sleep_field(self) -> None:
+        """
+        Validate just the sleep section while the user types (debounced
+        via _make_debounce_timer, so a burst of keystrokes runs this
+        once). Blank-so-far is NOT an error here — required-ness is only
+        enforced on submit, so the user isn't nagged mid-form.
+        """
+        hours_text = self.sleep_hours.text()
+        minutes_text = self.sleep_minutes.text()
+
+        if hours_text.strip() == "" and minutes_text.strip() == "":
+            self._set_label(self.sleep_error, "")
+            return
+
+        total = hm_to_minutes(hours_text, minutes_text, require_any=True)
+        if total is None:
+            self._set_label(self.sleep_error, "Sleep time must include hours or minutes (numbers only).")
+        else:
+            self._set_label(self.sleep_error, validate_total_minutes(total, "Sleep time") or "")
+
+
+
+    @Slot()
+    def check_exercise_field(self) -> None:
+        """
+        Same as check_sleep_field, for the exercise section.
+        """
+        hours_text = self.exercise_hours.text()
+        minutes_text = self.exercise_minutes.text()
+
+        if hours_text.strip() == "" and minutes_text.strip() == "":
+            self._set_label(self.exercise_error, "")
+            return
+
+        total = hm_to_minutes(hours_text, minutes_text, require_any=True)
+        if total is None:
+            self._set_label(self.exercise_error, "Exercise time must include hours or minutes (numbers only).")
+        else:
+            self._set_label(self.exercise_error, validate_total_minutes(total, "Exercise time") or "")
 
-        if "exercise_time" in errors:
-            self.exercise_error.setText(errors["exercise_time"])
 
-        if "mood_scale" in errors:
-            self.mood_scale_error.setText(errors["mood_scale"])
 
-        if "mood_tags" in errors:
-            self.mood_tags_error.setText(errors["mood_tags"])
+    @Slot()
+    def check_mood_field(self) -> None:
+        """
+        Validate the mood scale while the user types (debounced, like
+        the sleep and exercise checks).
+        """
+        text = self.mood_scale.text()
 
-        if "activities" in errors:
-            self.activities_error.setText(errors["activities"])
+        if text.strip() == "":
+            self._set_label(self.mood_scale_error, "")
+            return
 
+        value, parse_err = parse_float(text, "Mood scale")
+        if parse_err:
+            self._set_label(self.mood_scale_error, parse_err)
+        else:
+            self._set_label(self.mood_scale_error, validate_mood_scale(value) or "")
 
 
+
+    @Slot()
     def submit_entry(self) -> None:
         """
         Called when "Submit Entry" is clicked.
@@ -366,19 +689,10 @@ class EntryPage(QWidget):
         # Reset previous error text
         self.clear_errors()
 
-        # Ask validation module to process raw inputs
+        # Ask validation module to process raw inputs.
+        # The getters were bound once in __init__; this just calls them.
         entry, errors = create_daily_entry(
-            date_day_text=self.date_day.text(),
-            date_month_text=self.date_month.currentText(),
-            date_year_text=self.date_year.text(),
-            sleep_hours_text=self.sleep_hours.text(),
-            sleep_minutes_text=self.sleep_minutes.text(),
-            exercise_hours_text=self.exercise_hours.text(),
-            exercise_minutes_text=self.exercise_minutes.text(),
-            mood_scale_text=self.mood_scale.text(),
-            mood_tags_text=self.mood_tags.text(),
-            activities_text=self.activities.text(),
-            notes_text=self.notes.text(),
+            **{key: getter() for key, getter in self._field_getters}
         )
 
         # If validation failed → display errors → stop here
@@ -387,21 +701,147 @@ class EntryPage(QWidget):
             return
 
 
-        # Otherwise, save valid entry into CSV
-        action = upsert_entry(CSV_PATH, entry)
+        # No-op guard: identical to the last accepted entry AND the CSV
+        # untouched since then -> nothing to do. (Entry values are all
+        # hashable scalars, so the sorted-items tuple is a stable key.)
+        entry_hash = hash(tuple(sorted(entry.items())))
+        mtime = os.path.getmtime(CSV_PATH) if os.path.exists(CSV_PATH) else 0.0
+
+        if entry_hash == self._last_saved_hash and mtime == self._last_mtime:
+            self._set_label(self.status_label, "No change: entry already saved.")
+            return
+
+        self._last_saved_hash = entry_hash
+        self._last_mtime = mtime
+
+        # Otherwise, queue the valid entry for the next batch flush.
+        # Same-date resubmits just overwrite the pending slot.
+        self._pending[entry["date"]] = entry
+
+        if len(self._pending) >= self._flush_batch_size:
+            self.flush_pending()
+        else:
+            # (Re)start the debounce: one write covers a burst of submits.
+            self._flush_timer.start()
+
+        # Show progress (tracked too, so the next submit clears it).
+        # The row is only queued at this point — _on_flush_done switches
+        # this to "Saved" once the batch is actually on disk.
+        self._set_label(self.status_label, f"Saving entry for {entry['date']}…")
 
-        # Show confirmation
-        self.status_label.setText(f"Saved: entry {action} for {entry['date']}")
+        # Let listeners (the entries list) know there is new data.
+        self.entry_saved.emit(entry["date"])
 
         # Reset form fields (date left as-is for convenience)
-        self.sleep_hours.clear()
-        self.sleep_minutes.clear()
-        self.exercise_hours.clear()
-        self.exercise_minutes.clear()
-        self.mood_scale.clear()
-        self.mood_tags.clear()
-        self.activities.clear()
-        self.notes.clear()
+        for widget in self._clearable_fields:
+            widget.clear()
+
+
+
+    @Slot()
+    def flush_pending(self) -> None:
+        """
+        Hand the buffered entries to a pool thread to write in one batch,
+        keeping the GUI thread free during disk I/O.
+        Safe to call with an empty buffer (does nothing).
+        """
+        if not self._pending or self._flush_in_flight:
+            # If a write is already running, _on_flush_done will restart
+            # the timer and pick up whatever has accumulated since.
+            return
+
+        self._flush_timer.stop()
+
+        entries = list(self._pending.values())
+        self._pending.clear()
+        self._flush_in_flight = True
+        self._flushing_entries = entries
+
+        worker = _FlushWorker(CSV_PATH, entries)
+        worker.signals.done.connect(self._on_flush_done)
+        QThreadPool.globalInstance().start(worker)
+
+
+
+    @Slot(bool)
+    def _on_flush_done(self, ok: bool) -> None:
+        """
+        Runs back on the GUI thread once the worker finishes (or fails).
+        """
+        self._flush_in_flight = False
+
+        flushed = self._flushing_entries
+        self._flushing_entries = []
+
+        if not ok:
+            # The write failed (disk full, permissions, read-only CSV):
+            # put the batch back so nothing the user submitted is lost.
+            # setdefault, not assignment — an entry resubmitted while
+            # the worker was failing is newer and must win.
+            for entry in flushed:
+                self._pending.setdefault(entry["date"], entry)
+
+            self._set_label(
+                self.status_label,
+                f"Could not save to {CSV_PATH} — entries kept, retrying…",
+            )
+
+            # Retry on the usual debounce cycle (and on exit / next
+            # submit / entries-list visit as before).
+            self._flush_timer.start()
+            return
+
+        # Our own write just bumped the CSV's mtime; refresh the no-op
+        # guard so an unchanged resubmit is still recognized as such.
+        if os.path.exists(CSV_PATH):
+            self._last_mtime = os.path.getmtime(CSV_PATH)
+
+        # Re-announce the flushed dates now that they are on disk. If
+        # the entries list loaded the CSV during the debounce window, it
+        # read a file without these rows and cleared its dirty flag —
+        # this second emit marks it stale again so they show up.
+        for entry in flushed:
+            self.entry_saved.emit(entry["date"])
+
+        # Confirm, unless a newer submit is already showing its own
+        # "Saving…" message for the next batch.
+        if flushed and not self._pending:
+            self._set_label(self.status_label, f"Saved: entry for {flushed[-1]['date']}")
+
+        # Entries submitted while the worker was writing start a new cycle.
+        if self._pending:
+            self._flush_timer.start()
+
+
+
+    @Slot()
+    def flush_pending_sync(self) -> None:
+        """
+        Flush everything to disk on this thread, right now: wait out any
+        in-flight worker, then write the remainder directly.
+
+        Used on app exit (no event loop left to deliver worker signals)
+        and before the entries list loads, so the list never reads a CSV
+        that is missing a just-submitted row.
+        """
+        self._flush_timer.stop()
+
+        if self._flush_in_flight:
+            QThreadPool.globalInstance().waitForDone()
+            self._flush_in_flight = False
+
+        if self._pending:
+            entries = list(self._pending.values())
+            self._pending.clear()
+            upsert_entries_bulk(CSV_PATH, entries)
+
+            if os.path.exists(CSV_PATH):
+                self._last_mtime = os.path.getmtime(CSV_PATH)
+
+            # Same re-announcement as _on_flush_done: these rows only
+            # now exist on disk.
+            for entry in entries:
+                self.entry_saved.emit(entry["date"])
 
 
 
@@ -409,6 +849,8 @@ class EntryPage(QWidget):
 # Optional: allow this page to be run directly for testing
 # ================================================================
 if __name__ == "__main__":
+    import sys
+
     from PySide6.QtWidgets import QApplication
     app = QApplication(sys.argv)
     page = EntryPage()
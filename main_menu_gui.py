@@ -13,19 +13,28 @@ from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QStackedWidget
 )
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QPropertyAnimation, QEasingCurve, Slot
 
 from entry_page import EntryPage
 from view_entries_page import ViewEntriesPage
 
 
 class MainWindow(QMainWindow):
+    # Sidebar width when fully open, shared by layout + animation.
+    _SIDEBAR_WIDTH = 200
+
     def __init__(self):
         super().__init__()
 
         self.setWindowTitle("Personal Wellness Tracker")
         self.resize(1000, 700)
 
+        # Suspend painting while the window is assembled: every
+        # addWidget below would otherwise run an incremental layout
+        # pass. Updates come back on at the end of __init__, after the
+        # fully-built central widget is attached — one layout pass total.
+        self.setUpdatesEnabled(False)
+
         # ============================================================
         # CENTRAL WIDGET + OUTER (VERTICAL) LAYOUT
         # ============================================================
@@ -34,9 +43,11 @@ class MainWindow(QMainWindow):
         # [ top_bar (menu toggle) ]
         # [ main_row:  sidebar  |  stacked pages ]
         # ============================================================
+        # Note: the central widget is NOT attached to the window yet —
+        # while detached, child layout changes can't invalidate the
+        # window's geometry. setCentralWidget happens at the bottom.
         central = QWidget()
         outer_layout = QVBoxLayout(central)
-        self.setCentralWidget(central)
 
         # ---------------- Top bar (always visible) -------------------
         top_bar = QHBoxLayout()
@@ -61,9 +72,13 @@ class MainWindow(QMainWindow):
         outer_layout.addLayout(main_row, stretch=1)
 
         # ========== Sidebar ==========
+        # Width is capped (not fixed) so it can be animated down to 0 —
+        # a fixed width pins the minimum too, which would fight the
+        # animation below.
         self.sidebar_widget = QWidget()
         sidebar_layout = QVBoxLayout(self.sidebar_widget)
-        self.sidebar_widget.setFixedWidth(200)
+        self.sidebar_widget.setMinimumWidth(0)
+        self.sidebar_widget.setMaximumWidth(self._SIDEBAR_WIDTH)
 
         sidebar_layout.addWidget(QLabel("Navigation:"))
 
@@ -80,22 +95,33 @@ class MainWindow(QMainWindow):
 
         main_row.addWidget(self.sidebar_widget)
 
+        # One animation object, reused for every toggle. Animating
+        # maximumWidth slides the sidebar shut smoothly instead of the
+        # hide()/show() jump, and building the QPropertyAnimation once
+        # here avoids a QObject allocation per click.
+        self._sidebar_open = True
+        self._sidebar_anim = QPropertyAnimation(self.sidebar_widget, b"maximumWidth", self)
+        self._sidebar_anim.setDuration(120)
+        self._sidebar_anim.setEasingCurve(QEasingCurve.OutCubic)
+
         # ========== Stacked pages ==========
         self.stack = QStackedWidget()
         main_row.addWidget(self.stack, stretch=1)
 
         # ============================================================
-        # PAGES
+        # PAGES (built lazily)
         # ============================================================
-        self.entry_page = EntryPage()
-        self.entries_list_page = ViewEntriesPage()
-        self.graphs_page = self._make_placeholder_page("Graphs page (COMING SOON)")
-        self.import_export_page = self._make_placeholder_page("Import / Export page (COMING SOON)")
-
-        self.stack.addWidget(self.entry_page)          # index 0
-        self.stack.addWidget(self.entries_list_page)   # index 1
-        self.stack.addWidget(self.graphs_page)         # index 2
-        self.stack.addWidget(self.import_export_page)  # index 3
+        # Pages are only constructed the first time their nav button is
+        # clicked. Startup builds ONE page instead of four, so opening
+        # the app doesn't pay for widgets the user may never visit.
+        # ============================================================
+        self._page_factories = {
+            "entry": EntryPage,
+            "entries": ViewEntriesPage,
+            "graphs": lambda: self._make_placeholder_page("Graphs page (COMING SOON)"),
+            "import_export": lambda: self._make_placeholder_page("Import / Export page (COMING SOON)"),
+        }
+        self._pages: dict[str, QWidget] = {}
 
         # Hook nav buttons to pages
         self.entry_button.clicked.connect(self.show_entry_page)
@@ -106,6 +132,10 @@ class MainWindow(QMainWindow):
         # Start on entry page
         self.show_entry_page()
 
+        # Attach the finished tree and let Qt lay it out once.
+        self.setCentralWidget(central)
+        self.setUpdatesEnabled(True)
+
     # ---------------- Helper: placeholder page ----------------------
     def _make_placeholder_page(self, text: str) -> QWidget:
         page = QWidget()
@@ -116,32 +146,94 @@ class MainWindow(QMainWindow):
         return page
 
     # ---------------- Page switchers --------------------------------
+    def _show_page(self, key: str) -> QWidget:
+        """
+        Fetch-or-create the page for `key`, make it current, return it.
+        First visit builds the page and adds it to the stack; later
+        visits are just a stack switch.
+        """
+        page = self._pages.get(key)
+        if page is None:
+            page = self._page_factories[key]()
+            self._pages[key] = page
+            self.stack.addWidget(page)
+
+            # Saves on the entry page make the entries list stale; it
+            # reloads lazily on its next visit (see show_entries_list_page).
+            if key == "entry":
+                page.entry_saved.connect(self._on_entry_saved)
+
+        # Clicking the nav button for the page you're already on is a
+        # no-op: skipping setCurrentWidget avoids a redundant child scan
+        # and hide/show event pair on the current page.
+        if self.stack.currentWidget() is not page:
+            self.stack.setCurrentWidget(page)
+        return page
+
+    # @Slot() registers these in the class's meta-object up front, so
+    # connect() binds to a real slot instead of extending the
+    # meta-object at runtime, and each emit skips the generic
+    # Python-callable marshalling path.
+    @Slot()
     def show_entry_page(self) -> None:
-        self.stack.setCurrentWidget(self.entry_page)
+        self._show_page("entry")
 
+    @Slot()
     def show_entries_list_page(self) -> None:
-        self.entries_list_page.load_entries()
-        self.stack.setCurrentWidget(self.entries_list_page)
+        # Saves are write-behind on the entry page; push any buffered
+        # rows to disk first so the list never loads a CSV that is still
+        # missing a just-submitted entry.
+        entry_page = self._pages.get("entry")
+        if entry_page is not None:
+            entry_page.flush_pending_sync()
+
+        # Only reloads when a save happened since the last visit;
+        # otherwise switching tabs is a pure stack switch.
+        page = self._show_page("entries")
+        page.refresh_if_dirty()
+
+    @Slot(str)
+    def _on_entry_saved(self, _date: str) -> None:
+        """
+        An entry was saved: flag the entries list (if built) as stale.
+        If it hasn't been built yet, its first load covers it anyway.
+        """
+        entries_page = self._pages.get("entries")
+        if entries_page is not None:
+            entries_page.mark_dirty()
+
+            # If the user is already looking at the list (a background
+            # flush landed after they switched), reload right away
+            # instead of waiting for their next visit.
+            if self.stack.currentWidget() is entries_page:
+                entries_page.refresh_if_dirty()
 
+    @Slot()
     def show_graphs_page(self) -> None:
-        self.stack.setCurrentWidget(self.graphs_page)
+        self._show_page("graphs")
 
+    @Slot()
     def show_import_export_page(self) -> None:
-        self.stack.setCurrentWidget(self.import_export_page)
+        self._show_page("import_export")
 
     # ---------------- Sidebar toggle --------------------------------
+    @Slot()
     def toggle_sidebar(self) -> None:
         """
-        Show/hide the sidebar – the toggle button itself never disappears.
+        Slide the sidebar open/closed – the toggle button itself never
+        disappears. Re-clicking mid-slide just reverses direction from
+        the current width (stop() + new start value).
         """
-        is_visible = self.sidebar_widget.isVisible()
-
-        if is_visible:
-            self.sidebar_widget.hide()
-            self.menu_toggle_button.setText("Show Menu")
-        else:
-            self.sidebar_widget.show()
-            self.menu_toggle_button.setText("Hide Menu")
+        self._sidebar_open = not self._sidebar_open
+
+        self._sidebar_anim.stop()
+        self._sidebar_anim.setStartValue(self.sidebar_widget.maximumWidth())
+        self._sidebar_anim.setEndValue(self._SIDEBAR_WIDTH if self._sidebar_open else 0)
+        self._sidebar_anim.start()
+
+        self.menu_toggle_button.setText(
+            "Hide Menu" if self._sidebar_open else "Show Menu"
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,34 @@
+"""
+tools/precompile.py
+
+Pre-populate __pycache__ for every module in the project.
+
+Why this helps:
+- On a cold start, Python parses + byte-compiles each imported .py file
+  before running it. For a Qt app that's several modules' worth of
+  compile work on the first launch after install (or after clearing
+  caches).
+- Running this once after install/update writes the .pyc files up
+  front, so every later launch loads bytecode directly.
+
+Usage (from the project root):
+    python tools/precompile.py
+"""
+
+import compileall
+import os
+import sys
+
+
+def main() -> int:
+    # The project root is the parent of this tools/ directory, so the
+    # script works no matter where it is invoked from.
+    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+    # quiet=1 prints only errors; workers=0 uses one process per CPU.
+    ok = compileall.compile_dir(project_root, quiet=1, workers=0)
+    return 0 if ok else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
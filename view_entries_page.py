@@ -12,13 +12,18 @@ Visual structure:
     [ Scroll area with a vertical list of entry widgets ]
 """
 
-from typing import List, Dict
+import os
+from collections import deque
+from functools import lru_cache
+from operator import itemgetter
+from typing import Deque, List, Dict
 
 from PySide6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
-    QScrollArea, QFrame, QComboBox, QCheckBox
+    QScrollArea, QFrame, QComboBox, QCheckBox, QLayout
 )
-from PySide6.QtCore import Qt, Slot
+from PySide6.QtCore import Qt, Slot, Signal, QObject, QRunnable, QThreadPool, QTimer
+from PySide6.QtGui import QFont
 
 from data_io import read_entries
 from data_formatting import minutes_to_human, iso_date_to_human
@@ -26,6 +31,231 @@ from data_formatting import minutes_to_human, iso_date_to_human
 # Same CSV path convention as the rest of the project
 CSV_PATH = "data/entries.csv"
 
+# How many entry cards to materialize per page. The first page covers a
+# month and a half of daily logging; older entries appear on demand via
+# the "Load more" button instead of costing widgets up front.
+_PAGE_SIZE = 50
+
+# How many cards to build per event-loop slice. A page is materialized
+# in chunks this size, with a QTimer.singleShot(0, ...) between chunks,
+# so scrolling / repaints / clicks stay responsive while a page of
+# fresh widgets is being constructed.
+_CHUNK_SIZE = 12
+
+
+# One shared bold font for every card's date label. setFont with a
+# shared QFont skips the CSS parse + per-widget style rebuild that
+# setStyleSheet("font-weight: bold;") used to run once per entry.
+_BOLD_FONT = QFont()
+_BOLD_FONT.setBold(True)
+
+
+# (display label, CSV key) for the expanded details pane, in the order
+# the fields appear in the file.
+_DETAIL_FIELDS = (
+    ("Date", "date"),
+    ("Sleep (minutes)", "sleep_minutes"),
+    ("Exercise (minutes)", "exercise_minutes"),
+    ("Mood scale", "mood_scale"),
+    ("Mood tags", "mood_tags"),
+    ("Activities", "activities"),
+    ("Notes", "notes"),
+)
+
+
+def _details_text(entry: Dict[str, str]) -> str:
+    """
+    Build the expanded-details text for one entry (one line per field).
+    Shared by EntryWidget construction and reuse (update_from).
+    """
+    return "\n".join(
+        f"{label}: {entry.get(key, '') or 'n/a'}" for label, key in _DETAIL_FIELDS
+    )
+
+
+def _safe_int(value: str) -> int:
+    """
+    Convert a string to int safely. If it fails, default to -1.
+
+    Using -1 means "unknown" values end up at the start of ascending lists
+    and at the end of descending lists, which is fine for this use case.
+
+    Stored minute values are plain integers, so int(value) succeeds for
+    essentially every row — one C-level parse instead of the old
+    int(float(value)) which built a throwaway float per row. The float
+    round-trip survives as the fallback for odd hand-edited values like
+    "480.0", and blanks skip straight to -1 without raising anything.
+    """
+    if not value:
+        return -1
+    try:
+        return int(value)
+    except ValueError:
+        try:
+            return int(float(value))
+        except ValueError:
+            return -1
+
+
+def _safe_float(value: str) -> float:
+    """
+    Convert a string to float safely. If it fails, default to -1.0.
+    Blanks (the common "no mood logged" case) skip the exception path.
+    """
+    if not value:
+        return -1.0
+    try:
+        return float(value)
+    except ValueError:
+        return -1.0
+
+
+# Sort field -> key function, built once at import. The loader picks
+# one entry per sort instead of walking an if-chain, and the table is
+# the single place to extend when new sortable fields appear.
+# The date key uses itemgetter — a C-level lookup with no Python frame
+# per row; every DictReader row is guaranteed a "date" key by the
+# header, and YYYY-MM-DD strings sort chronologically.
+_KEYFN = {
+    "mood": lambda e: _safe_float(e.get("mood_scale", "")),
+    "sleep": lambda e: _safe_int(e.get("sleep_minutes", "")),
+    "exercise": lambda e: _safe_int(e.get("exercise_minutes", "")),
+    "date": itemgetter("date"),
+}
+
+
+def _sort_key_for(field: str):
+    """
+    Return the sort-key function for one of the sortable fields
+    (unknown fields fall back to the date key). Module-level (not a
+    page method) so the background loader can sort on its worker thread
+    without touching any widget state.
+    """
+    return _KEYFN.get(field, _KEYFN["date"])
+
+
+@lru_cache(maxsize=4)
+def _cached_read(path: str, mtime_ns: int) -> tuple:
+    """
+    read_entries memoized on (path, file mtime). Sort-order changes and
+    re-visits hit the cache while the CSV is untouched — zero disk I/O
+    and zero re-parsing — and any write bumps the mtime, which keys a
+    fresh read. Returns a tuple so nothing can mutate the cached rows'
+    order in place.
+    """
+    return tuple(read_entries(path))
+
+
+def _file_mtime_ns(path: str) -> int:
+    """
+    The file's mtime in ns, or -1 if it doesn't exist yet (read_entries
+    will create it; the placeholder key just means that one read isn't
+    cache-shared).
+    """
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
+@lru_cache(maxsize=8)
+def _sorted_rows(path: str, mtime_ns: int, field: str) -> tuple:
+    """
+    The cached rows in ASCENDING order for one sort field. Cached per
+    (file version, field): flipping between fields the user has already
+    tried, or flipping Ascending/Descending (the caller just reverses a
+    copy), never re-reads or re-sorts anything. Eight slots comfortably
+    cover all four fields for the current file plus churn.
+    """
+    rows = _cached_read(path, mtime_ns)
+
+    # The CSV is kept date-sorted on disk (upsert_entry preserves
+    # order), so the default date sort needs no sort at all.
+    if field == "date":
+        return rows
+
+    # Decorate-sort-undecorate: parse every key in ONE linear pass,
+    # then sort index positions with the C-level list.__getitem__ as
+    # the key. The Python parse function runs exactly N times; the
+    # O(N log N) comparisons only touch pre-parsed floats/ints.
+    keyfn = _sort_key_for(field)
+    keys = [keyfn(e) for e in rows]
+    order = sorted(range(len(rows)), key=keys.__getitem__)
+    return tuple(rows[i] for i in order)
+
+
+class _LoaderSignals(QObject):
+    """
+    QRunnable can't emit signals itself; the loader carries this holder.
+    `loaded` delivers (request token, sorted entries) on the GUI thread.
+    """
+    loaded = Signal(int, list)
+
+
+class _EntriesLoader(QRunnable):
+    """
+    Reads + sorts the CSV on a pool thread so the UI thread never blocks
+    on disk I/O or an O(N log N) sort while switching to this page.
+    """
+
+    def __init__(self, file_path: str, sort_field: str, sort_reverse: bool, token: int):
+        super().__init__()
+        self.file_path = file_path
+        self.sort_field = sort_field
+        self.sort_reverse = sort_reverse
+        self.token = token
+        self.signals = _LoaderSignals()
+
+    def run(self) -> None:
+        # Ascending order comes from the per-field cache; descending is
+        # one reverse() of a fresh copy. An order-only flip is therefore
+        # a cache hit + O(N) reverse — no read, no parse, no sort.
+        entries = list(_sorted_rows(self.file_path, _file_mtime_ns(self.file_path), self.sort_field))
+        if self.sort_reverse:
+            entries.reverse()
+
+        self.signals.loaded.emit(self.token, entries)
+
+
+def _minutes_summary(prefix: str, raw: str, cache: Dict[str, str]) -> str:
+    """
+    Build one "Sleep: 7h 30min" style summary from a raw CSV minutes
+    string, memoized by the raw string. Entries repeat the same durations
+    constantly (everyone sleeps 480 minutes a lot), so across a rebuild
+    this parses each distinct value once instead of once per row.
+    """
+    summary = cache.get(raw)
+    if summary is None:
+        summary = f"{prefix}: n/a"
+        if raw not in ("", None):
+            try:
+                minutes = int(float(raw))
+                if minutes >= 0:
+                    # Compact human format, e.g. "7h 30min"; fall back
+                    # for 0 minutes if the helper returns empty.
+                    summary = f"{prefix}: {minutes_to_human(minutes, 1) or '0 mins'}"
+            except ValueError:
+                # If something weird is in the CSV, just leave as "n/a"
+                pass
+        cache[raw] = summary
+    return summary
+
+
+class _ClickableHeader(QWidget):
+    """
+    Plain widget that emits `clicked` on a left press. Serves as the
+    card header's click target without QPushButton's focus ring, hover
+    states, and button style machinery — one less styled control per
+    entry.
+    """
+
+    clicked = Signal()
+
+    def mousePressEvent(self, event) -> None:
+        if event.button() == Qt.LeftButton:
+            self.clicked.emit()
+        super().mousePressEvent(event)
+
 
 class EntryWidget(QFrame):
     """
@@ -38,7 +268,14 @@ class EntryWidget(QFrame):
     Clicking the header toggles the details area.
     """
 
-    def __init__(self, entry: Dict[str, str], parent: QWidget | None = None):
+    def __init__(
+        self,
+        entry: Dict[str, str],
+        mood_summary: str,
+        sleep_summary: str,
+        exercise_summary: str,
+        parent: QWidget | None = None,
+    ):
         super().__init__(parent)
 
         # Make this look like a "card" instead of a plain label
@@ -53,68 +290,30 @@ class EntryWidget(QFrame):
         # ------------------------------------------------
         header_row = QHBoxLayout()
 
-        # --- Date (human friendly) ---
-        raw_date = entry.get("date", "")
-        if raw_date:
-            # Uses your iso_date_to_human, e.g. "01 January 2025"
-            human_date = iso_date_to_human(raw_date)
-        else:
-            human_date = "Unknown date"
+        # --- Date + summaries ---
+        # All texts are filled in by update_from at the bottom of
+        # __init__ (and again when the widget is reused from the pool).
+        # Summary strings are formatted by the parent page in one
+        # memoized pre-pass (see _minutes_summary), so this widget never
+        # parses CSV strings — it just puts finished text into labels.
+        self.date_label = QLabel()
+        self.date_label.setFont(_BOLD_FONT)
 
-        self.date_label = QLabel(human_date)
-        self.date_label.setStyleSheet("font-weight: bold;")
+        self.mood_label = QLabel()
+        self.sleep_label = QLabel()
+        self.exercise_label = QLabel()
 
-        # --- Mood summary ---
-        mood_value = entry.get("mood_scale", "")
-        if mood_value != "":
-            mood_text = f"Mood: {mood_value}"
-        else:
-            mood_text = "Mood: n/a"
-        self.mood_label = QLabel(mood_text)
-
-        # --- Sleep summary (stored as minutes) ---
-        sleep_minutes_str = entry.get("sleep_minutes", "")
-        sleep_summary = "Sleep: n/a"
-        if sleep_minutes_str not in ("", None):
-            try:
-                sleep_minutes_int = int(float(sleep_minutes_str))
-                if sleep_minutes_int >= 0:
-                    # Compact human format, e.g. "7h 30mins"
-                    sleep_human = minutes_to_human(sleep_minutes_int, 1)
-                    if not sleep_human:
-                        # If helper returns empty for 0 minutes, fall back
-                        sleep_human = "0 mins"
-                    sleep_summary = f"Sleep: {sleep_human}"
-            except ValueError:
-                # If something weird is in the CSV, just leave as "n/a"
-                pass
-        self.sleep_label = QLabel(sleep_summary)
-
-        # --- Exercise summary (stored as minutes) ---
-        exercise_minutes_str = entry.get("exercise_minutes", "")
-        exercise_summary = "Exercise: n/a"
-        if exercise_minutes_str not in ("", None):
-            try:
-                exercise_minutes_int = int(float(exercise_minutes_str))
-                if exercise_minutes_int >= 0:
-                    exercise_human = minutes_to_human(exercise_minutes_int, 1)
-                    if not exercise_human:
-                        exercise_human = "0 mins"
-                    exercise_summary = f"Exercise: {exercise_human}"
-            except ValueError:
-                pass
-        self.exercise_label = QLabel(exercise_summary)
+        # Last-applied (mood, sleep, exercise) visibility triple; fresh
+        # labels start visible. Lets set_header_visibility skip the
+        # three setVisible calls when nothing actually changed.
+        self._visibility = (True, True, True)
 
         # Make the whole header clickable (not just tiny text)
-        self.header_button = QPushButton()
-        self.header_button.setFlat(True)
-        self.header_button.setLayout(header_row)
+        self.header = _ClickableHeader()
+        self.header.setLayout(header_row)
 
         # Make the row itself taller so the bigger font fits comfortably
-        self.header_button.setMinimumHeight(40)  # try 40–48 and see what looks best
-
-        self.header_button.setFlat(True)  # looks like plain text
-        self.header_button.setLayout(header_row)
+        self.header.setMinimumHeight(40)  # try 40–48 and see what looks best
 
         # Header layout: [Date]  [stretch]  [Mood]  [Sleep]  [Exercise]
         header_row.addWidget(self.date_label)
@@ -125,43 +324,74 @@ class EntryWidget(QFrame):
         header_row.addSpacing(16)
         header_row.addWidget(self.exercise_label)
 
-        layout.addWidget(self.header_button)
+        layout.addWidget(self.header)
 
         # ------------------------------------------------
         # Details area - hidden by default
         # ------------------------------------------------
-        self.details_widget = QWidget()
-        details_layout = QVBoxLayout(self.details_widget)
-
-        def add_field_label(label_text: str, key: str) -> None:
-            """
-            Small helper so all detail rows look consistent.
-            Shows a label on the left and the raw value on the right.
-            """
-            row = QHBoxLayout()
-            lbl = QLabel(label_text)
-            val = QLabel(str(entry.get(key, "")))
-            row.addWidget(lbl)
-            row.addStretch()
-            row.addWidget(val)
-            details_layout.addLayout(row)
-
-        # Show every column from the CSV in the details
-        add_field_label("Date", "date")
-        add_field_label("Sleep (minutes)", "sleep_minutes")
-        add_field_label("Exercise (minutes)", "exercise_minutes")
-        add_field_label("Mood scale", "mood_scale")
-        add_field_label("Mood tags", "mood_tags")
-        add_field_label("Activities", "activities")
-        add_field_label("Notes", "notes")
-
-        layout.addWidget(self.details_widget)
-
-        # Start with details hidden (collapsed)
-        self.details_widget.setVisible(False)
+        # ONE multi-line QLabel instead of seven labels in a nested
+        # layout — and it isn't even created until the first expand
+        # (see _ensure_details): most cards are never opened, so the
+        # common case skips the label, its font metrics, and the text
+        # layout entirely.
+        self.details_widget: QLabel | None = None
+        self._layout = layout
 
         # Connect header click -> toggle details
-        self.header_button.clicked.connect(self.toggle_details)
+        self.header.clicked.connect(self.toggle_details)
+
+        # Fill in all the texts (also hides the details pane).
+        self.update_from(entry, mood_summary, sleep_summary, exercise_summary)
+
+    def _ensure_details(self) -> QLabel:
+        """
+        Build the details label on first use (hidden), from the entry
+        remembered by update_from.
+        """
+        if self.details_widget is None:
+            label = QLabel(_details_text(self._entry))
+            label.setTextFormat(Qt.PlainText)
+            label.setWordWrap(True)
+            label.setVisible(False)
+            self._layout.addWidget(label)
+            self.details_widget = label
+        return self.details_widget
+
+    def update_from(
+        self,
+        entry: Dict[str, str],
+        mood_summary: str,
+        sleep_summary: str,
+        exercise_summary: str,
+    ) -> None:
+        """
+        Point this card at a (possibly different) entry by re-setting
+        label texts. Reusing a pooled card this way skips the whole
+        QFrame + layouts + button construction and the stylesheet work
+        that a fresh EntryWidget would pay.
+        """
+        # Remembered so the page can recognize a card that already
+        # displays this exact row (see _build_page_widgets) and skip
+        # even the label writes.
+        self._entry = entry
+
+        self.entry_date = entry.get("date", "")
+
+        if self.entry_date:
+            # Uses your iso_date_to_human, e.g. "01 January 2025"
+            self.date_label.setText(iso_date_to_human(self.entry_date))
+        else:
+            self.date_label.setText("Unknown date")
+
+        self.mood_label.setText(mood_summary)
+        self.sleep_label.setText(sleep_summary)
+        self.exercise_label.setText(exercise_summary)
+
+        # Details text is rebuilt lazily from self._entry; if the pane
+        # already exists, refresh it and collapse.
+        if self.details_widget is not None:
+            self.details_widget.setText(_details_text(entry))
+            self.details_widget.setVisible(False)
 
     def set_header_visibility(
         self,
@@ -172,18 +402,37 @@ class EntryWidget(QFrame):
         """
         Called by the parent page when the user toggles which fields to
         show in the collapsed summary row.
+
+        setVisible on an already-correct label still walks the widget's
+        event machinery, so an unchanged triple returns before touching
+        any label — the common case for pooled cards on reload.
         """
+        triple = (show_mood, show_sleep, show_exercise)
+        if triple == self._visibility:
+            return
+        self._visibility = triple
+
         self.mood_label.setVisible(show_mood)
         self.sleep_label.setVisible(show_sleep)
         self.exercise_label.setVisible(show_exercise)
 
+    def set_details_visible(self, visible: bool) -> None:
+        """
+        Show/hide the details pane, building it only when it actually
+        has to become visible. Hiding a never-built pane is a no-op.
+        """
+        if visible:
+            self._ensure_details().setVisible(True)
+        elif self.details_widget is not None:
+            self.details_widget.setVisible(False)
+
     @Slot()
     def toggle_details(self) -> None:
         """
         Show details if hidden, hide if shown.
         """
-        currently_visible = self.details_widget.isVisible()
-        self.details_widget.setVisible(not currently_visible)
+        details = self._ensure_details()
+        details.setVisible(not details.isVisible())
 
 
 class ViewEntriesPage(QWidget):
@@ -203,6 +452,13 @@ class ViewEntriesPage(QWidget):
 
         main_layout = QVBoxLayout(self)
 
+        # Control changes are debounced through these single-shot
+        # timers: changing the sort field AND the order in quick
+        # succession (or ticking two summary boxes) coalesces into one
+        # reload / one visibility pass instead of two.
+        self._reload_timer = self._make_debounce_timer(self.load_entries)
+        self._visibility_timer = self._make_debounce_timer(self.apply_header_visibility)
+
         # ------------------------------------------------
         # Controls row: expand/collapse + sort controls
         # ------------------------------------------------
@@ -233,9 +489,13 @@ class ViewEntriesPage(QWidget):
         self.sort_order_combo.addItem("Ascending", "asc")
         self.sort_order_combo.addItem("Descending", "desc")
 
-        # Whenever sort settings change, we reload entries.
-        self.sort_field_combo.currentIndexChanged.connect(self.load_entries)
-        self.sort_order_combo.currentIndexChanged.connect(self.load_entries)
+        # Whenever sort settings change, we reload entries (debounced).
+        # Connected to the zero-arg _schedule_reload, NOT directly to
+        # _reload_timer.start: these signals carry an int, which would
+        # match the start(int msec) overload and overwrite the debounce
+        # interval with the combo index.
+        self.sort_field_combo.currentIndexChanged.connect(self._schedule_reload)
+        self.sort_order_combo.currentIndexChanged.connect(self._schedule_reload)
 
         controls_row.addSpacing(20)
         controls_row.addWidget(sort_label)
@@ -260,10 +520,12 @@ class ViewEntriesPage(QWidget):
         self.show_exercise_checkbox = QCheckBox("Exercise")
         self.show_exercise_checkbox.setChecked(True)
 
-        # Any time these change, we update all header rows.
-        self.show_mood_checkbox.stateChanged.connect(self.apply_header_visibility)
-        self.show_sleep_checkbox.stateChanged.connect(self.apply_header_visibility)
-        self.show_exercise_checkbox.stateChanged.connect(self.apply_header_visibility)
+        # Any time these change, we update all header rows (debounced).
+        # Same indirection as the sort combos above: stateChanged also
+        # carries an int that must not reach QTimer.start(int).
+        self.show_mood_checkbox.stateChanged.connect(self._schedule_visibility_pass)
+        self.show_sleep_checkbox.stateChanged.connect(self._schedule_visibility_pass)
+        self.show_exercise_checkbox.stateChanged.connect(self._schedule_visibility_pass)
 
         header_toggle_row.addWidget(self.show_mood_checkbox)
         header_toggle_row.addWidget(self.show_sleep_checkbox)
@@ -275,24 +537,70 @@ class ViewEntriesPage(QWidget):
         # ------------------------------------------------
         # Scroll area with all entry widgets
         # ------------------------------------------------
+        # Shown while a background load is reading the CSV; hidden once
+        # the widgets are built.
+        self.loading_label = QLabel("Loading entries…")
+        self.loading_label.setVisible(False)
+        main_layout.addWidget(self.loading_label)
+
         self.scroll_area = QScrollArea()
         self.scroll_area.setWidgetResizable(True)
 
         # Container inside the scroll area that holds all EntryWidgets
         self.entries_container = QWidget()
-        self.entries_layout = QVBoxLayout(self.entries_container)
+        self.entries_layout = self._new_entries_layout()
         # Stretch at the bottom keeps items pinned to the top
         self.entries_layout.addStretch()
+        self.entries_container.setLayout(self.entries_layout)
 
         self.scroll_area.setWidget(self.entries_container)
         main_layout.addWidget(self.scroll_area)
 
+        # Below the scroll area (so rebuilds never destroy it): fetches
+        # the next _PAGE_SIZE entries. Hidden when everything is shown.
+        self.load_more_button = QPushButton("Load more")
+        self.load_more_button.clicked.connect(self.load_more)
+        self.load_more_button.setVisible(False)
+        main_layout.addWidget(self.load_more_button)
+
         # Keep track of EntryWidgets so we can expand/collapse and
         # apply header-visibility toggles later.
         self.entry_widgets: List[EntryWidget] = []
 
-        # Initial load
-        self.load_entries()
+        # No initial load here: the list is built on the first visit via
+        # refresh_if_dirty(), so constructing the page (or starting the
+        # app) never pays for a CSV parse the user may not look at.
+        # Starts dirty so the first visit always loads.
+        self._dirty = True
+
+        # Monotonic id of the latest requested load; stale background
+        # results (token mismatch) are discarded in _on_entries_loaded.
+        self._load_token = 0
+
+        # Pagination state: the full sorted entry list from the last
+        # load, how many of them have been queued for widgets, and the
+        # per-load summary memo tables (see _build_chunk_widgets).
+        self._entries: List[Dict[str, str]] = []
+        self._shown_count = 0
+
+        # Entries queued for materialization, drained _CHUNK_SIZE at a
+        # time by _flush_pending (with an event-loop yield between
+        # chunks). The flag stops double-scheduling the flush.
+        self._pending: Deque[Dict[str, str]] = deque()
+        self._flush_scheduled = False
+        self._sleep_cache: Dict[str, str] = {}
+        self._exercise_cache: Dict[str, str] = {}
+
+        # Last visibility triple applied across the list; lets
+        # apply_header_visibility bail out when the checkbox signals
+        # fire without a net change (matches each card's own skip).
+        self._last_visibility = (True, True, True)
+
+        # Widget pool, keyed by entry date. A reload usually changes one
+        # row, so instead of destroying and reconstructing every card,
+        # displaced cards park here (hidden) and get reused via
+        # update_from when their date shows up again.
+        self._pool: Dict[str, EntryWidget] = {}
 
     # ------------------------------------------------
     # Sorting helpers
@@ -312,109 +620,393 @@ class ViewEntriesPage(QWidget):
         """
         return self.sort_order_combo.currentData() == "desc"
 
-    @staticmethod
-    def _safe_int(value: str) -> int:
+    def _make_debounce_timer(self, on_timeout) -> QTimer:
+        """
+        Build one 50 ms single-shot timer that runs `on_timeout` once a
+        burst of control changes settles (restarted on every change).
         """
-        Convert a string to int safely. If it fails, default to -1.
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(50)
+        timer.timeout.connect(on_timeout)
+        return timer
+
+    # These two exist so the int-carrying control signals never connect
+    # straight to QTimer.start — that binds the start(int msec) overload
+    # and the signal's argument (combo index / check state) silently
+    # becomes the timer's new interval, destroying the debounce.
+    @Slot()
+    def _schedule_reload(self) -> None:
+        self._reload_timer.start()
+
+    @Slot()
+    def _schedule_visibility_pass(self) -> None:
+        self._visibility_timer.start()
 
-        Using -1 means "unknown" values end up at the start of ascending lists
-        and at the end of descending lists, which is fine for this use case.
+    def _new_entries_layout(self) -> QVBoxLayout:
         """
-        try:
-            return int(float(value))
-        except Exception:
-            return -1
+        Build the vertical layout for the entries container (used at
+        construction and again on every rebuild). Created DETACHED:
+        callers fill it with widgets first and attach it via
+        setLayout at the end, so the container sees one layout event
+        for the whole batch instead of one per added widget.
+
+        SetMinAndMaxSize pins the container's min/max to the layout's
+        own hint, so when one card expands its details Qt resizes the
+        container directly instead of re-asking every sibling card for
+        its minimum size.
+        """
+        layout = QVBoxLayout()
+        layout.setSizeConstraint(QLayout.SetMinAndMaxSize)
+        return layout
 
-    @staticmethod
-    def _safe_float(value: str) -> float:
+    # ------------------------------------------------
+    # Core loading / refreshing
+    # ------------------------------------------------
+
+    def mark_dirty(self) -> None:
         """
-        Convert a string to float safely. If it fails, default to -1.0.
+        Flag the list as stale. Called (via MainWindow) when EntryPage
+        saves something, so the next visit reloads from the CSV.
         """
-        try:
-            return float(value)
-        except Exception:
-            return -1.0
+        self._dirty = True
 
-    def _sort_key(self, entry: Dict[str, str]):
+    def refresh_if_dirty(self) -> None:
         """
-        Compute the key to use when sorting a single entry, based on
-        the current sort settings (field + order).
+        Reload only if something changed since the last load.
+        Re-visiting the page without new saves is a pure stack switch —
+        no CSV read, no widget rebuild.
         """
-        field = self._current_sort_field()
+        if self._dirty:
+            self.load_entries()
 
-        if field == "mood":
-            return self._safe_float(entry.get("mood_scale", ""))
-        if field == "sleep":
-            return self._safe_int(entry.get("sleep_minutes", ""))
-        if field == "exercise":
-            return self._safe_int(entry.get("exercise_minutes", ""))
+    @Slot()
+    def load_entries(self) -> None:
+        """
+        Kick off a reload: the CSV read + sort happen on a pool thread
+        (see _EntriesLoader) so switching to this page never blocks the
+        event loop on disk I/O. The widgets are built back on the GUI
+        thread in _on_entries_loaded.
+
+        The token guards against overlapping loads: each dispatch bumps
+        it, and results arriving with a stale token (the user changed
+        the sort again mid-read) are dropped.
+        """
+        self._load_token += 1
 
-        # Default: sort by date (YYYY-MM-DD strings sort chronologically)
-        return entry.get("date", "")
+        self.loading_label.setVisible(True)
 
-    # ------------------------------------------------
-    # Core loading / refreshing
-    # ------------------------------------------------
+        loader = _EntriesLoader(
+            CSV_PATH,
+            self._current_sort_field(),
+            self._current_sort_reverse(),
+            self._load_token,
+        )
+        loader.signals.loaded.connect(self._on_entries_loaded)
+        QThreadPool.globalInstance().start(loader)
 
-    def load_entries(self) -> None:
+    @Slot(int, list)
+    def _on_entries_loaded(self, token: int, entries: List[Dict[str, str]]) -> None:
+        """
+        Back on the GUI thread with the sorted entries: rebuild the
+        first page of EntryWidgets. The rest of the list stays as plain
+        dicts until the user clicks "Load more", so the visible cost is
+        bounded by _PAGE_SIZE, not the size of the CSV.
+
+        The rebuild is batched: painting is suspended on the container,
+        the old widgets are dropped in one go, and new widgets are
+        appended with O(1) addWidget calls (the bottom stretch is
+        re-added last instead of inserting above it every time, which
+        made each insert scan the layout's item list).
+        """
+        # A newer load was requested while this one was reading; let the
+        # newer result win.
+        if token != self._load_token:
+            return
+
+        self.loading_label.setVisible(False)
+
+        # Sort-only change with every row already on screen: reorder
+        # the existing widgets inside the live layout instead of
+        # rebuilding. The rows are the same dict objects (read cache),
+        # so no text, summary, or visibility work is needed — just
+        # native layout moves for the rows that actually shifted.
+        if self._try_reorder_in_place(entries):
+            self._entries = entries
+            self._dirty = False
+            return
+
+        # Full sorted list kept as data; widgets are built page by page.
+        self._entries = entries
+        self._shown_count = 0
+
+        # Fresh memo tables for the duration summaries; shared across
+        # every page of this load.
+        self._sleep_cache = {}
+        self._exercise_cache = {}
+
+        self.entries_container.setUpdatesEnabled(False)
+        try:
+            # Park every current card in the pool, then hand the old
+            # layout to a throwaway QWidget to detach it from the
+            # container in one move. The pooled cards are re-adopted by
+            # the container (and hidden) so only the layout machinery
+            # dies with the throwaway — the expensive widgets survive
+            # for reuse.
+            for w in self.entry_widgets:
+                self._pool[w.entry_date] = w
+            self.entry_widgets.clear()
+
+            trash = QWidget()
+            trash.setLayout(self.entries_layout)
+            for w in self._pool.values():
+                w.setParent(self.entries_container)
+                w.hide()
+            del trash
+
+            # Fresh DETACHED layout: filled first, attached at the end,
+            # so the container gets a single layout event.
+            self.entries_layout = self._new_entries_layout()
+
+            # Queue the first page and build only its first chunk
+            # synchronously — enough to paint something immediately.
+            # The rest of the page arrives chunk-by-chunk via
+            # _flush_pending, yielding to the event loop in between.
+            self._pending.clear()
+            self._queue_page()
+            self._build_chunk_widgets()
+
+            # Stretch at the bottom keeps items pinned to the top.
+            self.entries_layout.addStretch()
+
+            self.entries_container.setLayout(self.entries_layout)
+        finally:
+            self.entries_container.setUpdatesEnabled(True)
+
+        self._schedule_flush()
+
+        # The list now matches the CSV.
+        self._dirty = False
+
+    def _try_reorder_in_place(self, entries: List[Dict[str, str]]) -> bool:
         """
-        Load all entries from CSV (or SQLite in the future), apply
-        the current sort choice, and rebuild the list of EntryWidgets.
+        If `entries` is a permutation of the rows currently shown (same
+        dict objects, everything materialized, nothing still queued),
+        reorder the live widgets with layout moves and return True.
+        Returns False when a real rebuild is needed (file changed, rows
+        added/removed, or part of the list is still unmaterialized).
+
+        Two paths:
+        - full reverse (the Ascending/Descending toggle): insertWidget(0, w)
+          over the widgets in current order — N native moves, no lookups.
+        - general permutation: walk target positions and move only the
+          widgets that are not already where they belong.
         """
-        # Remove old widgets from layout
-        for w in self.entry_widgets:
-            w.setParent(None)
-        self.entry_widgets.clear()
+        if self._pending or not self.entry_widgets:
+            return False
+        if len(self.entry_widgets) != len(self._entries) or len(entries) != len(self._entries):
+            return False
+
+        # Map row object -> current position. Identity holds only while
+        # the CSV (and therefore the read cache) is unchanged; any edit
+        # produces fresh dicts and falls through to the rebuild.
+        old_index = {id(e): i for i, e in enumerate(self._entries)}
+        perm = []
+        for entry in entries:
+            i = old_index.get(id(entry))
+            if i is None:
+                return False
+            perm.append(i)
 
-        # Pull entries from CSV
-        entries = read_entries(CSV_PATH)
+        self.entries_container.setUpdatesEnabled(False)
+        try:
+            if perm == list(range(len(perm) - 1, -1, -1)):
+                # Reverse fast path: prepending each widget in current
+                # order flips the list; the trailing stretch never moves.
+                for w in self.entry_widgets:
+                    self.entries_layout.insertWidget(0, w)
+                self.entry_widgets.reverse()
+            else:
+                reordered = [self.entry_widgets[i] for i in perm]
+                for new_pos, w in enumerate(reordered):
+                    # insertWidget on a widget already in the layout is
+                    # a move; rows already in place cost one itemAt.
+                    if self.entries_layout.itemAt(new_pos).widget() is not w:
+                        self.entries_layout.insertWidget(new_pos, w)
+                self.entry_widgets = reordered
+        finally:
+            self.entries_container.setUpdatesEnabled(True)
+
+        return True
+
+    def _queue_page(self) -> None:
+        """
+        Queue the next _PAGE_SIZE entries for materialization and update
+        the Load-more button with how much is left after them.
+        """
+        start = self._shown_count
+        end = min(start + _PAGE_SIZE, len(self._entries))
+        self._pending.extend(self._entries[start:end])
+        self._shown_count = end
 
-        # Sort entries based on user's choices
-        entries.sort(key=self._sort_key, reverse=self._current_sort_reverse())
+        remaining = len(self._entries) - end
+        if remaining > 0:
+            self.load_more_button.setText(f"Load more ({remaining} remaining)")
+        self.load_more_button.setVisible(remaining > 0)
+
+    def _schedule_flush(self) -> None:
+        """
+        Arrange for the next chunk of queued entries to be built after
+        the event loop has had a turn (singleShot(0) fires once pending
+        input/paint events are processed). The flag keeps at most one
+        flush in flight.
+        """
+        if self._pending and not self._flush_scheduled:
+            self._flush_scheduled = True
+            QTimer.singleShot(0, self._flush_pending)
+
+    @Slot()
+    def _flush_pending(self) -> None:
+        """
+        Build one chunk of queued entries into the (attached) layout,
+        above the trailing stretch, then re-schedule if more remain.
+        A reload that arrived in the meantime has already replaced the
+        queue, so draining whatever is pending is always current.
+        """
+        self._flush_scheduled = False
+        if not self._pending:
+            return
+
+        self.entries_container.setUpdatesEnabled(False)
+        try:
+            # Pull the trailing stretch off, append the chunk, put it back.
+            self.entries_layout.takeAt(self.entries_layout.count() - 1)
+            self._build_chunk_widgets()
+            self.entries_layout.addStretch()
+        finally:
+            self.entries_container.setUpdatesEnabled(True)
 
+        self._schedule_flush()
+
+    def _build_chunk_widgets(self) -> None:
+        """
+        Append widgets for up to _CHUNK_SIZE queued entries (assumes the
+        trailing stretch is absent — callers remove/re-add it). Summary
+        text is formatted here (memoized per distinct value) so the
+        widget itself does zero parsing.
+        """
         # Summary visibility choices (we reuse these for every widget)
         show_mood = self.show_mood_checkbox.isChecked()
         show_sleep = self.show_sleep_checkbox.isChecked()
         show_exercise = self.show_exercise_checkbox.isChecked()
 
-        # Rebuild entry widgets
-        for entry in entries:
-            widget = EntryWidget(entry, parent=self.entries_container)
-            # Insert above the final stretch item
-            self.entries_layout.insertWidget(self.entries_layout.count() - 1, widget)
+        for _ in range(min(_CHUNK_SIZE, len(self._pending))):
+            entry = self._pending.popleft()
+            # Reuse a pooled card for this date if one exists; only
+            # genuinely new dates pay for widget construction.
+            widget = self._pool.pop(entry.get("date", ""), None)
+
+            if widget is not None and widget._entry is entry:
+                # Same row object (the read cache returns identical
+                # dicts while the CSV is unchanged — e.g. a sort
+                # toggle): the card's text is already right, so this is
+                # a pure reorder. No formatting, no label writes.
+                widget.show()
+            else:
+                mood_value = entry.get("mood_scale", "")
+                mood_summary = f"Mood: {mood_value}" if mood_value != "" else "Mood: n/a"
+                sleep_summary = _minutes_summary(
+                    "Sleep", entry.get("sleep_minutes", ""), self._sleep_cache
+                )
+                exercise_summary = _minutes_summary(
+                    "Exercise", entry.get("exercise_minutes", ""), self._exercise_cache
+                )
+
+                if widget is None:
+                    widget = EntryWidget(
+                        entry,
+                        mood_summary=mood_summary,
+                        sleep_summary=sleep_summary,
+                        exercise_summary=exercise_summary,
+                        parent=self.entries_container,
+                    )
+                else:
+                    widget.update_from(entry, mood_summary, sleep_summary, exercise_summary)
+                    widget.show()
+
+            self.entries_layout.addWidget(widget)
             widget.set_header_visibility(show_mood, show_sleep, show_exercise)
             self.entry_widgets.append(widget)
 
+    @Slot()
+    def load_more(self) -> None:
+        """
+        Queue the next page of entries; the first chunk is built right
+        away (immediate feedback for the click), the rest drain through
+        the same chunked flush as the initial load.
+        """
+        self._queue_page()
+        self._flush_pending()
+
     # ------------------------------------------------
     # Header visibility helpers
     # ------------------------------------------------
 
+    @Slot()
     def apply_header_visibility(self) -> None:
         """
         Called when the user toggles any of the "Show in summary" checkboxes.
         Applies the visibility choice to all existing EntryWidgets.
+
+        Batched like expand/collapse below: one repaint for the whole
+        list instead of one per flipped label. A debounced burst that
+        lands back on the same triple (check + uncheck) skips the list
+        walk entirely.
         """
         show_mood = self.show_mood_checkbox.isChecked()
         show_sleep = self.show_sleep_checkbox.isChecked()
         show_exercise = self.show_exercise_checkbox.isChecked()
 
-        for w in self.entry_widgets:
-            w.set_header_visibility(show_mood, show_sleep, show_exercise)
+        triple = (show_mood, show_sleep, show_exercise)
+        if triple == self._last_visibility:
+            return
+        self._last_visibility = triple
+
+        self.entries_container.setUpdatesEnabled(False)
+        try:
+            for w in self.entry_widgets:
+                w.set_header_visibility(show_mood, show_sleep, show_exercise)
+        finally:
+            self.entries_container.setUpdatesEnabled(True)
 
     # ------------------------------------------------
     # Expand / collapse helpers
     # ------------------------------------------------
 
+    def _set_all_details_visible(self, visible: bool) -> None:
+        """
+        Flip every entry's details pane with painting suspended on the
+        container, so N visibility changes cost one relayout/repaint
+        instead of N — the difference between a click and a stall once
+        the list holds hundreds of entries.
+        """
+        self.entries_container.setUpdatesEnabled(False)
+        try:
+            for w in self.entry_widgets:
+                w.set_details_visible(visible)
+        finally:
+            self.entries_container.setUpdatesEnabled(True)
+
+    @Slot()
     def expand_all(self) -> None:
         """
         Show details for every entry.
         """
-        for w in self.entry_widgets:
-            w.details_widget.setVisible(True)
+        self._set_all_details_visible(True)
 
+    @Slot()
     def collapse_all(self) -> None:
         """
         Hide details for every entry.
         """
-        for w in self.entry_widgets:
-            w.details_widget.setVisible(False)
+        self._set_all_details_visible(False)